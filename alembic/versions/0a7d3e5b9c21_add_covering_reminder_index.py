@@ -0,0 +1,39 @@
+"""add covering reminder index to user_preferences
+
+Revision ID: 0a7d3e5b9c21
+Revises: f6c2a9e4d810
+Create Date: 2026-10-16 14:12:36.480517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a7d3e5b9c21'
+down_revision: Union[str, None] = 'f6c2a9e4d810'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_user_preferences_reminder_due',
+        'user_preferences',
+        ['reminder_enabled', 'reminder_type', 'reminder_time_hour'],
+        unique=False,
+        postgresql_include=['user_id', 'timezone', 'active_days_mask'],
+    )
+    op.drop_index('ix_user_preferences_reminder_time_hour', table_name='user_preferences')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_user_preferences_reminder_time_hour',
+        'user_preferences',
+        ['reminder_time_hour', 'reminder_enabled'],
+        unique=False,
+    )
+    op.drop_index('ix_user_preferences_reminder_due', table_name='user_preferences')
@@ -0,0 +1,57 @@
+"""convert reminder_enabled/reminder_type to boolean/smallint
+
+Revision ID: 1b8e4f6a2d93
+Revises: 0a7d3e5b9c21
+Create Date: 2026-10-16 14:31:07.915264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b8e4f6a2d93'
+down_revision: Union[str, None] = '0a7d3e5b9c21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'user_preferences',
+        'reminder_enabled',
+        existing_type=sa.String(length=10),
+        type_=sa.Boolean(),
+        existing_nullable=True,
+        postgresql_using="reminder_enabled = 'true'",
+    )
+    # Anything other than 0/1/2 never received reminders, so it becomes 0 (no reminders)
+    op.alter_column(
+        'user_preferences',
+        'reminder_type',
+        existing_type=sa.String(length=10),
+        type_=sa.SmallInteger(),
+        existing_nullable=True,
+        postgresql_using="CASE WHEN reminder_type IN ('0', '1', '2') THEN reminder_type::smallint ELSE 0 END",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'user_preferences',
+        'reminder_type',
+        existing_type=sa.SmallInteger(),
+        type_=sa.String(length=10),
+        existing_nullable=True,
+        postgresql_using="reminder_type::varchar",
+    )
+    op.alter_column(
+        'user_preferences',
+        'reminder_enabled',
+        existing_type=sa.Boolean(),
+        type_=sa.String(length=10),
+        existing_nullable=True,
+        postgresql_using="CASE reminder_enabled WHEN true THEN 'true' WHEN false THEN 'false' END",
+    )
@@ -0,0 +1,41 @@
+"""make reminder index partial on reminder_enabled
+
+Revision ID: 2c5f7a9d1e48
+Revises: 1b8e4f6a2d93
+Create Date: 2026-10-16 14:58:21.330146
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c5f7a9d1e48'
+down_revision: Union[str, None] = '1b8e4f6a2d93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index('ix_user_preferences_reminder_due', table_name='user_preferences')
+    op.create_index(
+        'ix_user_preferences_reminder_due',
+        'user_preferences',
+        ['reminder_type', 'reminder_time_hour'],
+        unique=False,
+        postgresql_include=['user_id', 'timezone', 'active_days_mask'],
+        postgresql_where=sa.text('reminder_enabled'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_preferences_reminder_due', table_name='user_preferences')
+    op.create_index(
+        'ix_user_preferences_reminder_due',
+        'user_preferences',
+        ['reminder_enabled', 'reminder_type', 'reminder_time_hour'],
+        unique=False,
+        postgresql_include=['user_id', 'timezone', 'active_days_mask'],
+    )
@@ -0,0 +1,33 @@
+"""add partial AVAILABLE index to user_lessons
+
+Revision ID: 3d9b2c6e8f57
+Revises: 2c5f7a9d1e48
+Create Date: 2026-10-16 15:16:44.602718
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d9b2c6e8f57'
+down_revision: Union[str, None] = '2c5f7a9d1e48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_user_lessons_available',
+        'user_lessons',
+        ['user_id', 'id'],
+        unique=False,
+        postgresql_include=['unlocked_at', 'completed_at'],
+        postgresql_where=sa.text("status = 'AVAILABLE'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_lessons_available', table_name='user_lessons')
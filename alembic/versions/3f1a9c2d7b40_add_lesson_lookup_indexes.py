@@ -0,0 +1,30 @@
+"""add lesson lookup indexes
+
+Revision ID: 3f1a9c2d7b40
+Revises: e7f84fc9e2a1
+Create Date: 2026-10-16 09:12:41.208311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1a9c2d7b40'
+down_revision: Union[str, None] = 'e7f84fc9e2a1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_weeks_topic_lower', 'weeks', [sa.text('lower(topic)')], unique=False)
+    op.create_index('ix_user_lessons_user_id_daily_lesson_id', 'user_lessons', ['user_id', 'daily_lesson_id'], unique=False)
+    op.create_index('ix_daily_lessons_week_id_day_number', 'daily_lessons', ['week_id', 'day_number'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_daily_lessons_week_id_day_number', table_name='daily_lessons')
+    op.drop_index('ix_user_lessons_user_id_daily_lesson_id', table_name='user_lessons')
+    op.drop_index('ix_weeks_topic_lower', table_name='weeks')
@@ -0,0 +1,37 @@
+"""add active_days_mask to user_preferences
+
+Revision ID: 5c7d9e1f2a86
+Revises: 8b2e5d14c6a3
+Create Date: 2026-10-16 11:34:52.870163
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c7d9e1f2a86'
+down_revision: Union[str, None] = '8b2e5d14c6a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('user_preferences', sa.Column('active_days_mask', sa.SmallInteger(), server_default='127', nullable=False))
+    # Backfill from the JSON list: bit i set for the i-th day, mon=0 ... sun=6.
+    # Rows whose active_days isn't an array (SQL NULL or JSON 'null') keep the
+    # all-days default, matching active_days_to_mask(None).
+    op.execute("""
+        UPDATE user_preferences
+        SET active_days_mask = COALESCE((
+            SELECT bit_or(1 << (array_position(ARRAY['mon','tue','wed','thu','fri','sat','sun'], day) - 1))
+            FROM json_array_elements_text(active_days) AS day
+        ), 0)
+        WHERE active_days IS NOT NULL AND json_typeof(active_days) = 'array'
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('user_preferences', 'active_days_mask')
@@ -0,0 +1,32 @@
+"""add partial locked lesson index
+
+Revision ID: 8b2e5d14c6a3
+Revises: 3f1a9c2d7b40
+Create Date: 2026-10-16 11:20:07.514926
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2e5d14c6a3'
+down_revision: Union[str, None] = '3f1a9c2d7b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_user_lessons_locked',
+        'user_lessons',
+        ['user_id', 'daily_lesson_id'],
+        unique=False,
+        postgresql_where=sa.text("status = 'LOCKED'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_lessons_locked', table_name='user_lessons', postgresql_where=sa.text("status = 'LOCKED'"))
@@ -0,0 +1,32 @@
+"""add lesson_time index to user_preferences
+
+Revision ID: a41f6b8c3d29
+Revises: 5c7d9e1f2a86
+Create Date: 2026-10-16 12:02:18.436517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41f6b8c3d29'
+down_revision: Union[str, None] = '5c7d9e1f2a86'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_user_preferences_lesson_time_user_id',
+        'user_preferences',
+        ['lesson_time', 'user_id'],
+        unique=False,
+        postgresql_ops={'lesson_time': 'varchar_pattern_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_preferences_lesson_time_user_id', table_name='user_preferences')
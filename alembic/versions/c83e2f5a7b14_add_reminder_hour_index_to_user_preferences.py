@@ -0,0 +1,31 @@
+"""add reminder hour index to user_preferences
+
+Revision ID: c83e2f5a7b14
+Revises: a41f6b8c3d29
+Create Date: 2026-10-16 12:41:09.127853
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c83e2f5a7b14'
+down_revision: Union[str, None] = 'a41f6b8c3d29'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_user_preferences_reminder_hour',
+        'user_preferences',
+        [sa.text('substr(reminder_time, 1, 2)'), 'reminder_enabled'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_preferences_reminder_hour', table_name='user_preferences')
@@ -0,0 +1,32 @@
+"""add timezone/lesson_time index to user_preferences
+
+Revision ID: d92a4b7e1c05
+Revises: c83e2f5a7b14
+Create Date: 2026-10-16 13:05:42.318604
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd92a4b7e1c05'
+down_revision: Union[str, None] = 'c83e2f5a7b14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_user_preferences_timezone_lesson_time',
+        'user_preferences',
+        ['timezone', 'lesson_time'],
+        unique=False,
+        postgresql_ops={'lesson_time': 'varchar_pattern_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_preferences_timezone_lesson_time', table_name='user_preferences')
@@ -0,0 +1,77 @@
+"""add generated lesson/reminder hour columns to user_preferences
+
+Revision ID: e4b1c8d6f3a7
+Revises: d92a4b7e1c05
+Create Date: 2026-10-16 13:27:15.604291
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b1c8d6f3a7'
+down_revision: Union[str, None] = 'd92a4b7e1c05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _hour_of(time_column: str) -> str:
+    return f"CASE WHEN {time_column} ~ '^[0-9]{{2}}:' THEN CAST(substr({time_column}, 1, 2) AS SMALLINT) END"
+
+
+def upgrade() -> None:
+    op.add_column(
+        'user_preferences',
+        sa.Column('lesson_time_hour', sa.SmallInteger(), sa.Computed(_hour_of('lesson_time'), persisted=True), nullable=True),
+    )
+    op.add_column(
+        'user_preferences',
+        sa.Column('reminder_time_hour', sa.SmallInteger(), sa.Computed(_hour_of('reminder_time'), persisted=True), nullable=True),
+    )
+
+    # Integer hour indexes replace the string prefix/expression indexes
+    op.drop_index('ix_user_preferences_timezone_lesson_time', table_name='user_preferences')
+    op.drop_index('ix_user_preferences_lesson_time_user_id', table_name='user_preferences')
+    op.drop_index('ix_user_preferences_reminder_hour', table_name='user_preferences')
+    op.create_index(
+        'ix_user_preferences_lesson_time_hour',
+        'user_preferences',
+        ['lesson_time_hour', 'timezone'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_user_preferences_reminder_time_hour',
+        'user_preferences',
+        ['reminder_time_hour', 'reminder_enabled'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_preferences_reminder_time_hour', table_name='user_preferences')
+    op.drop_index('ix_user_preferences_lesson_time_hour', table_name='user_preferences')
+    op.create_index(
+        'ix_user_preferences_reminder_hour',
+        'user_preferences',
+        [sa.text('substr(reminder_time, 1, 2)'), 'reminder_enabled'],
+        unique=False,
+    )
+    op.create_index(
+        'ix_user_preferences_lesson_time_user_id',
+        'user_preferences',
+        ['lesson_time', 'user_id'],
+        unique=False,
+        postgresql_ops={'lesson_time': 'varchar_pattern_ops'},
+    )
+    op.create_index(
+        'ix_user_preferences_timezone_lesson_time',
+        'user_preferences',
+        ['timezone', 'lesson_time'],
+        unique=False,
+        postgresql_ops={'lesson_time': 'varchar_pattern_ops'},
+    )
+    op.drop_column('user_preferences', 'reminder_time_hour')
+    op.drop_column('user_preferences', 'lesson_time_hour')
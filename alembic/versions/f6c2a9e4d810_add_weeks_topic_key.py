@@ -0,0 +1,34 @@
+"""add generated topic_key column to weeks
+
+Revision ID: f6c2a9e4d810
+Revises: e4b1c8d6f3a7
+Create Date: 2026-10-16 13:48:52.771930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6c2a9e4d810'
+down_revision: Union[str, None] = 'e4b1c8d6f3a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'weeks',
+        sa.Column('topic_key', sa.String(), sa.Computed('lower(topic)', persisted=True), nullable=False),
+    )
+    # Plain index on the stored column replaces the lower(topic) expression index
+    op.drop_index('ix_weeks_topic_lower', table_name='weeks')
+    op.create_index('ix_weeks_topic_key', 'weeks', ['topic_key'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_weeks_topic_key', table_name='weeks')
+    op.create_index('ix_weeks_topic_lower', 'weeks', [sa.text('lower(topic)')], unique=False)
+    op.drop_column('weeks', 'topic_key')
@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session
 import csv
 import io
 import json
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 
 from app.services import admin_service
 from app.api import deps
@@ -580,13 +580,13 @@ async def trigger_daily_lesson_unlock_job(
     current_user: User = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
 ):
-    """Manually trigger the daily lesson unlock job"""
+    """Manually trigger the lesson unlock step of the hourly job (no reminders are sent)"""
     try:
-        from app.core.scheduler import daily_lesson_unlock_job
-        unlocked_count = daily_lesson_unlock_job()
+        from app.services.scheduler_service import SchedulerService
+        unlocked_count = SchedulerService(db).unlock_due_lessons(datetime.now(timezone.utc))
         return APIResponse(
             success=True,
-            message=f"Daily lesson unlock job completed successfully",
+            message=f"Lesson unlock job completed successfully",
             data={"unlocked_lessons": unlocked_count}
         )
     except Exception as e:
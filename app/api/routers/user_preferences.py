@@ -5,6 +5,7 @@ from app.api.deps import get_db, get_current_active_user
 from app.models.user import User
 from app.models.user_preferences import UserPreferences
 from app.schemas.user_preferences import UserPreferencesResponse, UserPreferencesUpdate
+from app.services.scheduler_service import invalidate_configured_hours
 from app.utils.response import APIResponse, APIException
 
 router = APIRouter(prefix="/user-preferences", tags=["user-preferences"])
@@ -83,12 +84,22 @@ async def update_user_preferences(
     if "reminder_enabled" in update_data and update_data["reminder_enabled"] == "false":
         update_data["reminder_type"] = "0"
     
+    # Reminder settings are stored as Boolean/SmallInteger
+    if update_data.get("reminder_enabled") is not None:
+        update_data["reminder_enabled"] = update_data["reminder_enabled"] == "true"
+    if update_data.get("reminder_type") is not None:
+        update_data["reminder_type"] = int(update_data["reminder_type"])
+    
     for field, value in update_data.items():
         setattr(preferences, field, value)
     
     db.commit()
     db.refresh(preferences)
     
+    # The scheduler skips hours nobody has configured, so let it see new times
+    if "lesson_time" in update_data or "reminder_time" in update_data:
+        invalidate_configured_hours()
+    
     return APIResponse(
         success=True,
         message="User preferences updated successfully",
@@ -21,31 +21,17 @@ job_defaults = {
 
 scheduler = BackgroundScheduler(executors=executors, job_defaults=job_defaults)
 
-def daily_lesson_unlock_job():
-    """Scheduled job to unlock due lessons"""
-    db = SessionLocal()
-    try:
-        service = SchedulerService(db)
-        unlocked_count = service.unlock_due_lessons()
-        logger.info(f"Daily lesson unlock job completed: Unlocked {unlocked_count} lessons")
-        return unlocked_count
-    except Exception as e:
-        logger.error(f"Daily lesson unlock job failed: {e}")
-        raise
-    finally:
-        db.close()
-
-def daily_reminder_job():
-    """Send daily reminders to users"""
+def hourly_scheduler_job():
+    """Unlock due lessons, then send reminders, from one snapshot of the current time"""
     import asyncio
     db = SessionLocal()
     try:
         service = SchedulerService(db)
-        sent_count = asyncio.run(service.send_daily_reminders())
-        logger.info(f"Daily reminder job completed: Sent {sent_count} reminders")
-        return sent_count
+        result = asyncio.run(service.run_hourly())
+        logger.info(f"Hourly scheduler job completed: Unlocked {result['unlocked']} lessons, sent {result['reminders_sent']} reminders")
+        return result
     except Exception as e:
-        logger.error(f"Daily reminder job failed: {e}")
+        logger.error(f"Hourly scheduler job failed: {e}")
         raise
     finally:
         db.close()
@@ -66,21 +52,12 @@ def daily_support_email_job():
 def start_scheduler():
     """Start the background scheduler"""
     try:
-        # Add lesson unlock job (runs every hour)
+        # Add hourly job: lesson unlock followed by reminders (runs every hour)
         scheduler.add_job(
-            daily_lesson_unlock_job,
+            hourly_scheduler_job,
             trigger=CronTrigger(minute=0),  # Every hour at minute 0
-            id='hourly_lesson_unlock',
-            name='Hourly Lesson Unlock Job',
-            replace_existing=True
-        )
-        
-        # Add daily reminder job runs every hour
-        scheduler.add_job(
-            daily_reminder_job,
-            trigger=CronTrigger(minute=0),
-            id='daily_reminder',
-            name='Daily Reminder Job',
+            id='hourly_scheduler',
+            name='Hourly Lesson Unlock and Reminder Job',
             replace_existing=True
         )
         
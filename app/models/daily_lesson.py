@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, ForeignKey, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -24,3 +24,7 @@ class DailyLesson(Base):
     # Relationship with Week
     week = relationship("Week", back_populates="daily_lessons")
     user_lessons = relationship("UserLesson", back_populates="daily_lesson")
+
+    __table_args__ = (
+        Index("ix_daily_lessons_week_id_day_number", "week_id", "day_number"),
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -43,5 +43,24 @@ class UserLesson(Base):
     user_journey = relationship("UserJourney", back_populates="user_lessons")
     daily_lesson = relationship("DailyLesson", back_populates="user_lessons")
     
+    __table_args__ = (
+        Index("ix_user_lessons_user_id_daily_lesson_id", "user_id", "daily_lesson_id"),
+        # Enum columns store member names, hence 'LOCKED' rather than 'locked'
+        Index(
+            "ix_user_lessons_locked",
+            "user_id",
+            "daily_lesson_id",
+            postgresql_where=text("status = 'LOCKED'"),
+        ),
+        # Per-user AVAILABLE lookups: reminder counts, first available lesson, miss counts
+        Index(
+            "ix_user_lessons_available",
+            "user_id",
+            "id",
+            postgresql_include=["unlocked_at", "completed_at"],
+            postgresql_where=text("status = 'AVAILABLE'"),
+        ),
+    )
+    
     def __repr__(self):
         return f"<UserLesson(id={self.id}, user_id={self.user_id}, daily_lesson_id={self.daily_lesson_id}, status={self.status})>"
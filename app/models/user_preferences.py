@@ -1,8 +1,28 @@
-from sqlalchemy import Column, Integer, String, JSON, DateTime, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, Column, Computed, Integer, SmallInteger, String, JSON, DateTime, ForeignKey, Index, text
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 from app.core.database import Base
 
+# Bit per weekday, in datetime.weekday() order (mon=0x01 ... sun=0x40)
+ACTIVE_DAY_BITS = {day: 1 << i for i, day in enumerate(("mon", "tue", "wed", "thu", "fri", "sat", "sun"))}
+ALL_DAYS_MASK = 0x7F
+
+
+def active_days_to_mask(active_days) -> int:
+    """Encode a list of day names ("mon".."sun") as a 7-bit weekday mask"""
+    if active_days is None:
+        return ALL_DAYS_MASK
+    mask = 0
+    for day in active_days:
+        mask |= ACTIVE_DAY_BITS.get(day, 0)
+    return mask
+
+
+def _hour_of(time_column: str) -> str:
+    """SQL for the hour of an "HH:MM" column; NULL when the value isn't in that format"""
+    return f"CASE WHEN {time_column} ~ '^[0-9]{{2}}:' THEN CAST(substr({time_column}, 1, 2) AS SMALLINT) END"
+
+
 class UserPreferences(Base):
     __tablename__ = "user_preferences"
 
@@ -12,13 +32,16 @@ class UserPreferences(Base):
     # Lesson scheduling preferences
     frequency = Column(String(20), default="daily")  # daily, weekly
     active_days = Column(JSON, default=["mon", "tue", "wed", "thu", "fri", "sat", "sun"])
+    active_days_mask = Column(SmallInteger, default=ALL_DAYS_MASK, nullable=False)  # active_days as bits, kept in sync on write
     lesson_time = Column(String(5), default="09:00")  # HH:MM format
+    lesson_time_hour = Column(SmallInteger, Computed(_hour_of("lesson_time"), persisted=True))  # Generated from lesson_time
     timezone = Column(String(50), default="ET")  # ET, CT, MT, PT, BDT
     
     # Reminder preferences
-    reminder_enabled = Column(String(10), default="true")  # true, false
+    reminder_enabled = Column(Boolean, default=True)  # API exposes "true"/"false"
     reminder_time = Column(String(5), default="14:00")  # HH:MM format
-    reminder_type = Column(String(10), default="1")  # 0=No reminders, 1=Send 1 reminder, 2=Send 2 reminders
+    reminder_time_hour = Column(SmallInteger, Computed(_hour_of("reminder_time"), persisted=True))  # Generated from reminder_time
+    reminder_type = Column(SmallInteger, default=1)  # 0=No reminders, 1=Send 1 reminder, 2=Send 2 reminders (API exposes "0"/"1"/"2")
     
     # Lesson progression
     days_between_lessons = Column(Integer, default=1)  # Minimum days between lessons
@@ -29,3 +52,22 @@ class UserPreferences(Base):
 
     # Relationships
     user = relationship("User", back_populates="preferences")
+
+    __table_args__ = (
+        # Scheduler matches users by their lesson hour, then timezone
+        Index("ix_user_preferences_lesson_time_hour", "lesson_time_hour", "timezone"),
+        # Covers the reminder job's query so it can be answered by an index-only scan;
+        # users with reminders disabled are left out of the index entirely
+        Index(
+            "ix_user_preferences_reminder_due",
+            "reminder_type",
+            "reminder_time_hour",
+            postgresql_include=["user_id", "timezone", "active_days_mask"],
+            postgresql_where=text("reminder_enabled"),
+        ),
+    )
+
+    @validates("active_days")
+    def _sync_active_days_mask(self, key, value):
+        self.active_days_mask = active_days_to_mask(value)
+        return value
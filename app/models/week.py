@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON
+from sqlalchemy import Column, Computed, Integer, String, Text, DateTime, JSON, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -10,6 +10,7 @@ class Week(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     topic = Column(String, nullable=False)  # Five categories: Clarity, Consistency, Connection, Courage, Curiosity
+    topic_key = Column(String, Computed("lower(topic)", persisted=True), nullable=False)  # Lowercased topic for case-insensitive lookups
     week_number = Column(Integer, nullable=False)  # 1 to 7
     title = Column(String, nullable=False)
     intro = Column(Text, nullable=False)
@@ -19,3 +20,8 @@ class Week(Base):
 
     # Relationship with DailyLesson
     daily_lessons = relationship("DailyLesson", back_populates="week")
+
+    __table_args__ = (
+        # Case-insensitive topic lookups: Week.topic_key == category.lower()
+        Index("ix_weeks_topic_key", "topic_key"),
+    )
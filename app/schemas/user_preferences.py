@@ -34,6 +34,16 @@ class UserPreferencesBase(BaseModel):
         if v not in valid_timezones:
             raise ValueError(f"Timezone must be one of: {', '.join(valid_timezones)}")
         return v
+    
+    @field_validator('reminder_enabled', 'reminder_type', mode='before')
+    @classmethod
+    def reminder_fields_to_str(cls, v):
+        """Convert stored Boolean/SmallInteger values to the API's string form"""
+        if isinstance(v, bool):
+            return "true" if v else "false"
+        if isinstance(v, int):
+            return str(v)
+        return v
 
 
 class UserPreferencesResponse(UserPreferencesBase):
@@ -54,4 +64,20 @@ class UserPreferencesUpdate(BaseModel):
     reminder_enabled: Optional[str] = None
     reminder_time: Optional[str] = None
     reminder_type: Optional[str] = None
+    
+    @field_validator('reminder_enabled')
+    @classmethod
+    def validate_reminder_enabled(cls, v):
+        """Validate reminder_enabled is either true or false"""
+        if v is not None and v not in ("true", "false"):
+            raise ValueError("reminder_enabled must be one of: true, false")
+        return v
+    
+    @field_validator('reminder_type')
+    @classmethod
+    def validate_reminder_type(cls, v):
+        """Validate reminder_type is one of the supported options"""
+        if v is not None and v not in ("0", "1", "2"):
+            raise ValueError("reminder_type must be one of: 0, 1, 2")
+        return v
 
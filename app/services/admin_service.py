@@ -1,7 +1,7 @@
 from typing import List, Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_
-from datetime import datetime, timedelta
+from sqlalchemy import func, and_, or_, case
+from datetime import datetime, timedelta, timezone
 
 from app.models.user import User
 from app.models.assessment_result import AssessmentResult
@@ -182,33 +182,45 @@ def search_users(db: Session, search_request: UserSearchRequest) -> List[UserWit
 def get_comprehensive_dashboard_stats(db: Session) -> Dict[str, Any]:
     """Get comprehensive admin dashboard statistics"""
     
-    # Total Users
-    total_users = db.query(User).count()
-    active_users = db.query(User).filter(User.is_active == True).count()
-    
-    # User roles breakdown
-    participants = db.query(User).filter(User.role == "participant").count()
-    coaches = db.query(User).filter(User.role == "coach").count()
-    admins = db.query(User).filter(User.role == "admin").count()
+    # Recent activity window (last 30 days); one aware "now" for the whole report
+    now = datetime.now(timezone.utc)
+    thirty_days_ago = now - timedelta(days=30)
+    
+    # Total users, role breakdown and recent sign-ups in a single scan
+    user_counts = db.query(
+        func.count(User.id).label("total_users"),
+        func.count(case((User.is_active == True, 1))).label("active_users"),
+        func.count(case((User.role == "participant", 1))).label("participants"),
+        func.count(case((User.role == "coach", 1))).label("coaches"),
+        func.count(case((User.role == "admin", 1))).label("admins"),
+        func.count(case((User.created_at >= thirty_days_ago, 1))).label("recent_users"),
+    ).one()
+    total_users = user_counts.total_users
+    active_users = user_counts.active_users
+    participants = user_counts.participants
+    coaches = user_counts.coaches
+    admins = user_counts.admins
+    recent_users = user_counts.recent_users
     
     # Assessments Taken
     total_assessments_taken = db.query(AssessmentResult).count()
     unique_users_assessed = db.query(AssessmentResult.user_id).distinct().count()
     
-    # Journey Statistics (based on user_journey table)
-    total_journeys = db.query(UserJourney).count()
-    journey_completed = db.query(UserJourney).filter(
-        UserJourney.total_categories_completed >= 5
-    ).count()
-    journey_running = db.query(UserJourney).filter(
-        UserJourney.total_categories_completed < 5
-    ).count()
+    # Journey Statistics (based on user_journey table), aggregated in one query
+    journey_counts = db.query(
+        func.count(UserJourney.id).label("total_journeys"),
+        func.count(case((UserJourney.total_categories_completed >= 5, 1))).label("journey_completed"),
+        func.count(case((UserJourney.total_categories_completed < 5, 1))).label("journey_running"),
+        func.avg(UserJourney.total_categories_completed).label("avg_categories_completed"),
+        func.count(case((UserJourney.total_categories_completed > 0, 1))).label("journeys_with_progress"),
+    ).one()
+    total_journeys = journey_counts.total_journeys
+    journey_completed = journey_counts.journey_completed
+    journey_running = journey_counts.journey_running
     
     # Additional journey insights
-    avg_categories_completed = db.query(func.avg(UserJourney.total_categories_completed)).scalar() or 0
-    journeys_with_progress = db.query(UserJourney).filter(
-        UserJourney.total_categories_completed > 0
-    ).count()
+    avg_categories_completed = journey_counts.avg_categories_completed or 0
+    journeys_with_progress = journey_counts.journeys_with_progress
     
     # Total Weeks and Lessons available
     total_weeks_available = db.query(Week).count()
@@ -216,21 +228,16 @@ def get_comprehensive_dashboard_stats(db: Session) -> Dict[str, Any]:
     
     
     # Recent activity (last 30 days)
-    thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-    
     recent_assessments = db.query(AssessmentResult).filter(
         AssessmentResult.created_at >= thirty_days_ago
     ).count()
     
-    recent_users = db.query(User).filter(
-        User.created_at >= thirty_days_ago
-    ).count()
-    
     # User Engagement Data (Last 30 days)
     user_engagement_data = []
+    day_names = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
     for i in range(30):
         # Calculate date for each day (today - i days)
-        target_date = datetime.utcnow() - timedelta(days=i)
+        target_date = now - timedelta(days=i)
         start_of_day = target_date.replace(hour=0, minute=0, second=0, microsecond=0)
         end_of_day = target_date.replace(hour=23, minute=59, second=59, microsecond=999999)
         
@@ -249,7 +256,6 @@ def get_comprehensive_dashboard_stats(db: Session) -> Dict[str, Any]:
         daily_active_users = max(assessment_users, journey_users)
         
         # Get day name and formatted date
-        day_names = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
         day_name = day_names[target_date.weekday()]
         formatted_date = target_date.strftime("%m/%d")
         
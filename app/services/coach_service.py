@@ -1,7 +1,7 @@
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_
 from typing import Dict, Any, List
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timezone
 
 from app.models.user import User
 from app.models.user_journey import UserJourney
@@ -10,7 +10,7 @@ from app.models.week import Week
 from app.models.daily_lesson import DailyLesson
 from app.models.user_progress import UserProgress
 from app.models.user_lesson import UserLesson, LessonStatus
-from app.models.user_preferences import UserPreferences
+from app.models.user_preferences import UserPreferences, ALL_DAYS_MASK
 from app.schemas.coach import CoachStats, ParticipantOverview, CoachDashboardResponse, CoachStatsResponse
 from app.utils.coach_email import send_coach_custom_email
 from pydantic import BaseModel
@@ -19,6 +19,32 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+def count_active_days_between(start: date, end: date, active_days_mask: int) -> int:
+    """
+    Count dates in [start, end) whose weekday is set in active_days_mask
+    
+    Args:
+        start: First date counted
+        end: Date counting stops at (exclusive)
+        active_days_mask: Weekday bits as in UserPreferences.active_days_mask
+    
+    Returns:
+        int: Number of active days in the range
+    """
+    days = (end - start).days
+    if days <= 0:
+        return 0
+    
+    # Every full week contains each active weekday once
+    full_weeks, remaining_days = divmod(days, 7)
+    count = full_weeks * bin(active_days_mask & 0x7F).count("1")
+    
+    first_weekday = start.weekday()
+    for offset in range(remaining_days):
+        if active_days_mask & (1 << ((first_weekday + offset) % 7)):
+            count += 1
+    return count
+
 
 class EmailResponse(BaseModel):
     """Email sending response"""
@@ -27,7 +53,11 @@ class EmailResponse(BaseModel):
     sent_count: Optional[int] = None
 
 
-def get_current_lesson_miss_count(db: Session, user_id: int) -> int:
+def get_current_lesson_miss_count(
+    db: Session,
+    user_id: int,
+    today: Optional[date] = None
+) -> int:
     """
     Calculate how many times the current available lesson has been missed
     based on user's active days since it was unlocked
@@ -35,6 +65,7 @@ def get_current_lesson_miss_count(db: Session, user_id: int) -> int:
     Args:
         db: Database session
         user_id: User ID to check
+        today: Current UTC date, if already computed by the caller
     
     Returns:
         int: Number of times the current lesson has been missed
@@ -49,42 +80,22 @@ def get_current_lesson_miss_count(db: Session, user_id: int) -> int:
     if not current_lesson or not current_lesson.unlocked_at:
         return 0  # No available lesson to miss
     
-    # Get user preferences for active days
-    user_preferences = db.query(UserPreferences).filter(
+    # Get user's active days as a weekday mask
+    active_days_mask = db.query(UserPreferences.active_days_mask).filter(
         UserPreferences.user_id == user_id
-    ).first()
+    ).scalar()
     
     # Default to all days if no preferences set
-    active_days = user_preferences.active_days if user_preferences else [
-        "mon", "tue", "wed", "thu", "fri", "sat", "sun"
-    ]
-    
-    # Map weekday numbers to day names
-    day_mapping = {
-        0: "mon", 
-        1: "tue", 
-        2: "wed", 
-        3: "thu", 
-        4: "fri", 
-        5: "sat", 
-        6: "sun"
-    }
+    if active_days_mask is None:
+        active_days_mask = ALL_DAYS_MASK
     
     # Get dates
     unlock_date = current_lesson.unlocked_at.date()
-    today = datetime.now(timezone.utc).date()
+    if today is None:
+        today = datetime.now(timezone.utc).date()
     
     # Count active days that have passed since unlock (excluding today)
-    missed_count = 0
-    current_date = unlock_date
-    
-    while current_date < today:
-        weekday = day_mapping[current_date.weekday()]
-        if weekday in active_days:
-            missed_count += 1
-        current_date += timedelta(days=1)
-    
-    return missed_count
+    return count_active_days_between(unlock_date, today, active_days_mask)
 
 
 def get_coach_stats(db: Session, coach_id: int) -> CoachStatsResponse:
@@ -128,6 +139,7 @@ def get_participants_overview(db: Session) -> List[ParticipantOverview]:
     ).all()
     
     participants_overview = []
+    today = datetime.now(timezone.utc).date()
     
     for user in participants:
         # Get user progress to calculate actual lesson completion percentage
@@ -167,7 +179,7 @@ def get_participants_overview(db: Session) -> List[ParticipantOverview]:
         current_category = user_journey.current_category if user_journey else None
         
         # Get current lesson miss count
-        current_lesson_missed_count = get_current_lesson_miss_count(db, user.id)
+        current_lesson_missed_count = get_current_lesson_miss_count(db, user.id, today=today)
         
         participants_overview.append(ParticipantOverview(
             user_name=user.full_name or f"{user.first_name} {user.last_name}",
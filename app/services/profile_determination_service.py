@@ -1,4 +1,5 @@
-from typing import Dict, List, Tuple
+import json
+from typing import Dict, List, Optional, Tuple
 from app.schemas.assessment import (
     ProfileDeterminationResult, LeadershipProfile, LearningTrack, 
     ProfileDeterminationContent
@@ -93,6 +94,26 @@ PROFILE_CONTENT_MAPPING = {
     }
 }
 
+DEFAULT_PROFILE_CONTENT = {
+    "growth_focus_summary": "Focus on developing your leadership skills in this area.",
+    "intentional_advantage_summary": "Leverage your strengths in this area to create greater impact."
+}
+
+# Flat content table indexed by growth_idx * 6 + advantage_idx
+CATEGORY_INDEX = {"clarity": 0, "consistency": 1, "connection": 2, "courage": 3, "curiosity": 4, "balanced": 5}
+_CONTENT_TABLE: List[Optional[Dict[str, str]]] = [None] * (len(CATEGORY_INDEX) * len(CATEGORY_INDEX))
+for (_growth, _advantage), _content in PROFILE_CONTENT_MAPPING.items():
+    _CONTENT_TABLE[CATEGORY_INDEX[_growth] * len(CATEGORY_INDEX) + CATEGORY_INDEX[_advantage]] = _content
+
+
+def get_profile_content(growth_focus: str, intentional_advantage: str) -> Dict[str, str]:
+    """Look up profile content summaries for a category pair, falling back to the default"""
+    growth_idx = CATEGORY_INDEX.get(growth_focus)
+    advantage_idx = CATEGORY_INDEX.get(intentional_advantage)
+    if growth_idx is None or advantage_idx is None:
+        return DEFAULT_PROFILE_CONTENT
+    return _CONTENT_TABLE[growth_idx * len(CATEGORY_INDEX) + advantage_idx] or DEFAULT_PROFILE_CONTENT
+
 
 # Leadership type mapping based on intentional advantage
 LEADERSHIP_TYPE_MAPPING = {
@@ -242,22 +263,78 @@ def determine_profile(category_scores: Dict[str, int], is_balanced: bool = False
         ProfileDeterminationResult with complete profile information
     """
     
+    # The cached result only depends on the derived categories, so attach the
+    # raw scores to a shallow copy instead of keying the cache on them
+    result = build_profile(*get_profile_key(category_scores, is_balanced))
+    return result.model_copy(update={"category_scores": category_scores})
+
+
+def determine_profile_json(category_scores: Dict[str, int], is_balanced: bool = False) -> bytes:
+    """
+    Same as determine_profile but returns the serialized JSON body, ready for
+    Response(content=..., media_type="application/json").
+    
+    The profile part is rendered once per triple and cached as bytes, so only the
+    raw category scores are serialized per call.
+    """
+    body_prefix = _build_profile_json_prefix(*get_profile_key(category_scores, is_balanced))
+    scores_json = json.dumps(category_scores, separators=(",", ":")).encode()
+    return body_prefix + b',"category_scores":' + scores_json + b"}"
+
+
+def get_profile_key(category_scores: Dict[str, int], is_balanced: bool = False) -> Tuple[str, str, bool]:
+    """
+    Get the hashable (growth_focus, intentional_advantage, is_balanced) key for the scores.
+    
+    Callers that already know the derived categories can skip this and pass the
+    key straight to build_profile.
+    """
     if is_balanced:
-        growth_focus = "balanced"
-        intentional_advantage = "balanced"
-    else:
-        # Find the lowest scoring category (growth focus)
-        growth_focus = min(category_scores, key=category_scores.get)
-        
-        # Find the highest scoring category (intentional advantage)
-        intentional_advantage = max(category_scores, key=category_scores.get)
+        return "balanced", "balanced", True
+    growth_focus, intentional_advantage = _find_growth_and_advantage(category_scores)
+    return growth_focus, intentional_advantage, False
+
+
+def _find_growth_and_advantage(category_scores: Dict[str, int]) -> Tuple[str, str]:
+    """
+    Find the lowest (growth focus) and highest (intentional advantage) scoring
+    categories in a single pass. Ties resolve to the first category and empty
+    scores raise ValueError, like min()/max().
+    """
+    if not category_scores:
+        raise ValueError("category_scores must not be empty")
+    
+    growth_focus = intentional_advantage = None
+    lowest_score = highest_score = None
+    
+    for category, score in category_scores.items():
+        if lowest_score is None or score < lowest_score:
+            growth_focus, lowest_score = category, score
+        if highest_score is None or score > highest_score:
+            intentional_advantage, highest_score = category, score
+    
+    return growth_focus, intentional_advantage
+
+
+def build_profile(growth_focus: str, intentional_advantage: str, is_balanced: bool = False) -> ProfileDeterminationResult:
+    """
+    Get the profile result for a (growth focus, intentional advantage, balanced) triple.
+    
+    Every reachable triple is prebuilt at import, so this is a dict lookup. Unknown
+    category names are built on demand and never cached, keeping the cache at a
+    fixed size with nothing to evict. Callers must not mutate the returned model.
+    """
+    result = _PROFILE_CACHE.get((growth_focus, intentional_advantage, is_balanced))
+    if result is None:
+        result = _create_profile_result(growth_focus, intentional_advantage, is_balanced)
+    return result
+
+
+def _create_profile_result(growth_focus: str, intentional_advantage: str, is_balanced: bool) -> ProfileDeterminationResult:
+    """Build the profile result without the raw category scores"""
     
     # Get profile content
-    content_key = (growth_focus, intentional_advantage)
-    profile_content_data = PROFILE_CONTENT_MAPPING.get(content_key, {
-        "growth_focus_summary": "Focus on developing your leadership skills in this area.",
-        "intentional_advantage_summary": "Leverage your strengths in this area to create greater impact."
-    })
+    profile_content_data = get_profile_content(growth_focus, intentional_advantage)
     
     # Get leadership type information
     leadership_type_data = LEADERSHIP_TYPE_MAPPING.get(intentional_advantage, LEADERSHIP_TYPE_MAPPING["balanced"])
@@ -283,8 +360,45 @@ def determine_profile(category_scores: Dict[str, int], is_balanced: bool = False
     
     return ProfileDeterminationResult(
         leadership_profile=leadership_profile,
-        category_scores=category_scores,
+        category_scores={},
         growth_focus=growth_focus,
         intentional_advantage=intentional_advantage,
         is_balanced_leader=is_balanced
     )
+
+
+def _build_profile_json_prefix(growth_focus: str, intentional_advantage: str, is_balanced: bool) -> bytes:
+    """Serialized profile result without category_scores and without the closing brace"""
+    body_prefix = _PROFILE_JSON_CACHE.get((growth_focus, intentional_advantage, is_balanced))
+    if body_prefix is None:
+        body_prefix = _render_json_prefix(build_profile(growth_focus, intentional_advantage, is_balanced))
+    return body_prefix
+
+
+def _render_json_prefix(result: ProfileDeterminationResult) -> bytes:
+    return result.model_dump_json(exclude={"category_scores"}).encode()[:-1]
+
+
+PROFILE_CATEGORIES = ("clarity", "consistency", "connection", "courage", "curiosity")
+
+# Complete tables of every reachable profile, filled once at import
+_PROFILE_CACHE: Dict[Tuple[str, str, bool], ProfileDeterminationResult] = {}
+_PROFILE_JSON_CACHE: Dict[Tuple[str, str, bool], bytes] = {}
+
+
+def _warm_profile_cache() -> None:
+    """Build every reachable profile once so each worker process starts with a warm cache"""
+    keys = [
+        (growth_focus, intentional_advantage, False)
+        for growth_focus in PROFILE_CATEGORIES
+        for intentional_advantage in PROFILE_CATEGORIES
+    ]
+    keys.append(("balanced", "balanced", True))
+    
+    for key in keys:
+        result = _create_profile_result(*key)
+        _PROFILE_CACHE[key] = result
+        _PROFILE_JSON_CACHE[key] = _render_json_prefix(result)
+
+
+_warm_profile_cache()
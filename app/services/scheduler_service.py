@@ -1,8 +1,11 @@
-from datetime import datetime, timezone, timedelta
-from typing import Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, and_
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+from sqlalchemy.orm import Session, contains_eager
+from sqlalchemy import or_, and_, case, column, func, select, update, values, Integer, Select
+import asyncio
 import logging
+import time
 
 from app.models.user import User
 from app.models.user_lesson import UserLesson, LessonStatus
@@ -12,33 +15,25 @@ from app.models.user_journey import UserJourney, JourneyStatus
 from app.models.user_preferences import UserPreferences
 from app.utils.response import APIException
 from app.utils.email import send_lesson_reminder
-from app.utils.sms import sms_service
+from app.utils.sms import sms_service, SMS_CONNECTION_POOL_SIZE
 
 logger = logging.getLogger(__name__)
 
-# Timezone offset mappings
-TIMEZONE_OFFSETS = {
-    "ET": -5,   # Eastern Time (UTC-5)
-    "CT": -6,   # Central Time (UTC-6)
-    "MT": -7,   # Mountain Time (UTC-7)
-    "PT": -8,   # Pacific Time (UTC-8)
-    "BDT": 6,   # Bangladesh Time (UTC+6)
+# IANA zone per timezone code, so DST shifts are applied automatically
+TIMEZONE_NAMES = {
+    "ET": "America/New_York",     # Eastern Time (UTC-5/-4)
+    "CT": "America/Chicago",      # Central Time (UTC-6/-5)
+    "MT": "America/Denver",       # Mountain Time (UTC-7/-6)
+    "PT": "America/Los_Angeles",  # Pacific Time (UTC-8/-7)
+    "BDT": "Asia/Dhaka",          # Bangladesh Time (UTC+6)
+}
+
+# tzinfo per timezone code, built once instead of per call
+TZINFO_OBJECTS = {
+    tz_code: ZoneInfo(zone_name)
+    for tz_code, zone_name in TIMEZONE_NAMES.items()
 }
 
-def get_current_hour_in_timezone(tz_code: str) -> int:
-    """
-    Get current hour in specified timezone
-    
-    Args:
-        tz_code: Timezone code (ET, CT, MT, PT, BDT)
-    
-    Returns:
-        int: Current hour (0-23) in specified timezone
-    """
-    offset_hours = TIMEZONE_OFFSETS.get(tz_code, -5)  # Default to ET
-    tz = timezone(timedelta(hours=offset_hours))
-    now = datetime.now(tz)
-    return now.hour
 # {
 #   "frequency": "daily",
 #   "activeDays": [
@@ -56,393 +51,399 @@ def get_current_hour_in_timezone(tz_code: str) -> int:
 #   "timezone": "ET"
 # }
 
+def _user_timezone_code():
+    """SQL expression for a user's timezone code; unknown/missing codes are treated as ET"""
+    return case(
+        (UserPreferences.timezone.in_(list(TZINFO_OBJECTS)), UserPreferences.timezone),
+        else_="ET"
+    )
+
+
+def _user_in_timezone(tz_code: str):
+    """Index-friendly timezone match; ET also covers missing/unknown codes"""
+    if tz_code != "ET":
+        return UserPreferences.timezone == tz_code
+    return or_(
+        UserPreferences.timezone == "ET",
+        UserPreferences.timezone.is_(None),
+        UserPreferences.timezone.notin_(list(TZINFO_OBJECTS))
+    )
+
+
+# Maximum lessons unlocked per transaction
+UNLOCK_BATCH_SIZE = 500
+
+# Maximum reminder notifications in flight at once; matches the SMS service's
+# connection pool and send threads so concurrent sends never wait on either
+NOTIFICATION_CONCURRENCY = SMS_CONNECTION_POOL_SIZE
+
+# How long the set of hours anyone has configured is reused before re-querying.
+# Longer than the hourly job interval so consecutive runs share one lookup;
+# preference writes clear it through invalidate_configured_hours().
+CONFIGURED_HOURS_TTL_SECONDS = 2 * 60 * 60
+
+# hour column name -> (loaded at, monotonic seconds; distinct hours)
+_configured_hours_cache: Dict[str, Tuple[float, FrozenSet[int]]] = {}
+
+
+def _get_configured_hours(db: Session, hour_column) -> FrozenSet[int]:
+    """Distinct non-NULL values of a UserPreferences hour column, cached for CONFIGURED_HOURS_TTL_SECONDS"""
+    cached = _configured_hours_cache.get(hour_column.key)
+    if cached and time.monotonic() - cached[0] < CONFIGURED_HOURS_TTL_SECONDS:
+        return cached[1]
+    
+    hours = frozenset(db.execute(
+        select(hour_column).where(hour_column.isnot(None)).distinct()
+    ).scalars())
+    _configured_hours_cache[hour_column.key] = (time.monotonic(), hours)
+    return hours
+
+
+def invalidate_configured_hours() -> None:
+    """Forget the cached configured hours after a lesson_time/reminder_time write"""
+    _configured_hours_cache.clear()
+
+
 class SchedulerService:
     """Service for handling scheduled background tasks"""
     
     def __init__(self, db: Session):
         self.db = db
 
-    def unlock_due_lessons(self) -> int:
+    async def run_hourly(self) -> Dict[str, int]:
+        """
+        Run the hourly unlock and reminder work against one shared clock reading
+        
+        Lessons are unlocked first, so reminders going out in the same hour
+        already count them. A failed unlock is logged and doesn't block reminders.
+        
+        Returns:
+            dict: Number of lessons unlocked and reminders sent
+        """
+        now = datetime.now(timezone.utc)
+        
+        try:
+            unlocked_count = self.unlock_due_lessons(now)
+        except Exception:
+            # Clear any aborted transaction so the reminder queries can still run
+            self.db.rollback()
+            logger.exception("Lesson unlock failed")
+            unlocked_count = 0
+        
+        sent_count = await self.send_daily_reminders(now)
+        return {"unlocked": unlocked_count, "reminders_sent": sent_count}
+
+    def unlock_due_lessons(self, now: Optional[datetime] = None) -> int:
         """
         Unlock lessons based on user preferences and their timezone
         Supports multiple timezones (ET, CT, MT, PT, BDT)
+        
+        Args:
+            now: Current UTC time (defaults to the time of the call)
         """
+        now = now or datetime.now(timezone.utc)
         unlocked_count = 0
         
-        try:
-            print(f"\n{'='*70}")
-            print(f"LESSON UNLOCK JOB STARTED (Multi-Timezone Optimized)")
-            print(f"{'='*70}")
-            
-            # Get users to process (optimized by timezone hours)
-            users_to_process = self._get_users_for_current_hour()
-            print(f"Users to process: {len(users_to_process)}")
- 
-            for user_id in users_to_process:
-                # Get the next lesson to unlock for this user (with all validations)
-                next_lesson = self._get_next_lesson_to_unlock(user_id)
-                
-                # If we get a lesson, it's ready to unlock (all checks passed)
-                if next_lesson:
-                    # Get user's timezone for timestamp
-                    prefs = self.db.query(UserPreferences).filter(
-                        UserPreferences.user_id == user_id
-                    ).first()
-                    user_tz = prefs.timezone if prefs else "ET"
-                    
-                    # Set timestamp in user's timezone
-                    offset_hours = TIMEZONE_OFFSETS.get(user_tz, -5)
-                    user_tz_obj = timezone(timedelta(hours=offset_hours))
-                    now_user_tz = datetime.now(user_tz_obj)
-                    
-                    next_lesson.status = LessonStatus.AVAILABLE
-                    next_lesson.unlocked_at = now_user_tz
-                    unlocked_count += 1
-                    print(f"Unlocked lesson {next_lesson.id} for user {user_id} ({user_tz})")
-            
-            self.db.commit()
-            print(f"\n{'='*70}")
-            print(f"LESSON UNLOCK COMPLETED: {unlocked_count} lessons unlocked")
-            print(f"{'='*70}\n")
-            return unlocked_count
-            
-        except Exception as e:
-            self.db.rollback()
-            raise e
+        # Nobody's lesson_time falls in this hour in any timezone: nothing to unlock
+        current_hours = {now.astimezone(tz_info).hour for tz_info in TZINFO_OBJECTS.values()}
+        if not current_hours & _get_configured_hours(self.db, UserPreferences.lesson_time_hour):
+            logger.debug("unlock: no users scheduled this hour")
+            return 0
+        
+        # Users due this hour (optimized by timezone hours), embedded as a subquery
+        users_to_process = self._get_users_for_current_hour(now)
+        
+        # Unlock every due user's next lesson with set-based UPDATEs, so
+        # selecting users, picking lessons and unlocking is a single statement.
+        # unlocked_at is timezone-aware, so a single UTC timestamp is the
+        # same instant as "now" in each user's own timezone.
+        # Rows already claimed by another scheduler worker are skipped
+        # (window functions can't be locked, hence the outer SELECT).
+        claimable_lessons = (
+            select(UserLesson.id)
+            .where(UserLesson.id.in_(self._get_next_lessons_to_unlock(users_to_process)))
+            .limit(UNLOCK_BATCH_SIZE)
+            .with_for_update(skip_locked=True)
+        )
+        unlock_batch = (
+            update(UserLesson)
+            .where(UserLesson.id.in_(claimable_lessons))
+            .values(status=LessonStatus.AVAILABLE, unlocked_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        
+        # One short transaction per batch bounds lock time; a failing batch only
+        # rolls back itself. Unlocked lessons drop out of the candidates (their
+        # successor's predecessor isn't completed), so the loop ends once a
+        # batch comes back short.
+        # commit()/rollback() rather than begin(): the session may already be
+        # in a transaction (e.g. autobegun by the configured-hours lookup).
+        while True:
+            try:
+                batch_count = self.db.execute(unlock_batch).rowcount
+                self.db.commit()
+            except Exception:
+                self.db.rollback()
+                raise
+            unlocked_count += batch_count
+            if batch_count < UNLOCK_BATCH_SIZE:
+                break
+        
+        logger.debug("unlock: unlocked=%d", unlocked_count)
+        return unlocked_count
 
-    def _get_users_for_current_hour(self) -> list:
+    def _get_users_for_current_hour(self, now: datetime) -> Select:
         """
-        Get users for current hour with multi-timezone support and optimization
+        Build a SELECT of the user ids due for a lesson this hour, with multi-timezone support
         
         Optimized approach:
-        1. Calculate current hour for each timezone
-        2. Filter by matching lesson_time hours (database level)
-        3. Check each user's timezone and active_day
-        4. Check LOCKED lessons only for matched users
+        1. Calculate current hour and weekday for each timezone
+        2. Match each user's timezone, lesson_time hour and active_days_mask
+           against that timezone's hour/weekday (database level)
         
         Why better?
-        - Reduces 10,000 users to ~400 users via database query
-        - Then filters by timezone-specific day/hour
-        - Only checks LOCKED lessons for final candidates
+        - Never executed on its own: the unlock UPDATE embeds it, so no user ids
+          travel to Python and back
+        - Users without LOCKED lessons simply yield no row in _get_next_lessons_to_unlock
         """
-        day_mapping = {0: "mon", 1: "tue", 2: "wed", 3: "thu", 4: "fri", 5: "sat", 6: "sun"}
-        
-        # Calculate current hour for each timezone
-        timezone_hours = {}
-        for tz_code in ["ET", "CT", "MT", "PT", "BDT"]:
-            tz_hour = get_current_hour_in_timezone(tz_code)
-            timezone_hours[tz_code] = tz_hour
-            print(f"{tz_code}: Current hour = {tz_hour:02d}:00")
-        
-        # Build target hours set
-        target_hours = set(timezone_hours.values())
-        print(f"\nTarget hours: {sorted(target_hours)}")
-        
-        # Build query conditions
-        hour_conditions = []
-        for hour in target_hours:
-            hour_conditions.append(
-                UserPreferences.lesson_time.like(f"{hour:02d}:%")
-            )
-        
-        # OPTIMIZED QUERY: Get users with matching lesson_time hours
-        candidates = self.db.query(UserPreferences).filter(
-            or_(*hour_conditions)
-        ).all()
-        
-        print(f"Hour-matched candidates: {len(candidates)}")
-        
-        if not candidates:
-            return []
-        
-        # Filter by timezone-specific day and hour
-        matched_users = []
-        for prefs in candidates:
-            user_tz = prefs.timezone or "ET"
-            
-            # Get current time in user's timezone
-            offset_hours = TIMEZONE_OFFSETS.get(user_tz, -5)
-            user_tz_obj = timezone(timedelta(hours=offset_hours))
-            user_now = datetime.now(user_tz_obj)
-            user_current_hour = user_now.hour
-            user_current_day = day_mapping[user_now.weekday()]
-            
-            # Check 1: Is today an active day for this user?
-            if user_current_day not in prefs.active_days:
-                continue
-            
-            # Check 2: Does lesson_time hour match current hour in THEIR timezone?
-            lesson_hour = int(prefs.lesson_time.split(":")[0])
-            if lesson_hour != user_current_hour:
-                continue
-            
-            # Both conditions met
-            matched_users.append(prefs.user_id)
-        
-        print(f"Day/hour matched users: {len(matched_users)}")
-        
-        if not matched_users:
-            return []
-        
-        # Check LOCKED lessons ONLY for matched users
-        users_with_locked = self.db.query(UserLesson.user_id).filter(
-            UserLesson.user_id.in_(matched_users),
-            UserLesson.status == LessonStatus.LOCKED
-        ).distinct().all()
-        
-        result = [user_id for (user_id,) in users_with_locked]
-        print(f"Users with LOCKED lessons: {len(result)}\n")
-        return result
+        # One condition per timezone: its current hour and weekday
+        target_hours = set()
+        schedule_conditions = []
+        for tz_code, tz_info in TZINFO_OBJECTS.items():
+            tz_now = now.astimezone(tz_info)
+            target_hours.add(tz_now.hour)
+            schedule_conditions.append(and_(
+                _user_in_timezone(tz_code),
+                UserPreferences.lesson_time_hour == tz_now.hour,
+                UserPreferences.active_days_mask.bitwise_and(1 << tz_now.weekday()) != 0
+            ))
+        
+        # Users without an active journey in a category can't have a lesson to unlock
+        return select(UserPreferences.user_id).join(UserJourney, and_(
+            UserJourney.user_id == UserPreferences.user_id,
+            UserJourney.status == JourneyStatus.ACTIVE,
+            UserJourney.current_category.isnot(None)
+        )).where(
+            UserPreferences.lesson_time_hour.in_(sorted(target_hours)),
+            or_(*schedule_conditions)
+        )
 
-    def _get_next_lesson_to_unlock(self, user_id: int) -> Optional[UserLesson]:
+    def _get_next_lessons_to_unlock(self, user_ids: Select) -> Select:
         """
-        Get the next lesson to unlock with validation
+        Build a SELECT of the lesson ids ready to unlock for the given users (a user id SELECT)
         
-        Only checks: Previous lesson completed (sequential learning)
-        Schedule controlled by: active_days + lesson_time (already filtered)
-        
-        Returns None if any check fails, returns lesson if ready to unlock
+        For each user, lessons of the active journey's current category are ordered
+        by week and day number. The first LOCKED lesson qualifies when it is the
+        first lesson of the category or its previous lesson is completed
+        (sequential learning). Schedule is controlled by active_days + lesson_time
+        (already filtered).
         """
-        # Get user's journey to find current category
-        user_journey = self.db.query(UserJourney).filter(
-            UserJourney.user_id == user_id,
-            UserJourney.status == JourneyStatus.ACTIVE
-        ).first()
-        
-        if not user_journey or not user_journey.current_category:
-            return None
-        
-        # Get all lessons for current category, ordered by week and day number
-        lessons = self.db.query(UserLesson).join(DailyLesson).join(Week).filter(
-            UserLesson.user_id == user_id,
-            Week.topic.ilike(user_journey.current_category)
-        ).order_by(Week.week_number, DailyLesson.day_number).all()
-
-        print("lessons", lessons)
-        
-        # Find the first LOCKED lesson and validate
-        for i, lesson in enumerate(lessons):
-            if lesson.status == LessonStatus.LOCKED:
-                # Only check: Previous lesson completed or doesn't exist
-                if i > 0:
-                    previous_lesson = lessons[i - 1]
-                    
-                    # Previous must be completed (not just AVAILABLE)
-                    if not previous_lesson.completed_at:
-                        print(f"Previous lesson {previous_lesson.id} not completed yet.")
-                        return None
-                
-                # Ready to unlock!
-                # Schedule controlled by: active_days + lesson_time
-                print(f"Lesson {lesson.id} ready to unlock!")
-                return lesson
-        
-        return None
+        lesson_order = (Week.week_number, DailyLesson.day_number)
+        
+        ordered_lessons = (
+            select(
+                UserLesson.id,
+                UserLesson.status,
+                func.row_number().over(
+                    partition_by=UserLesson.user_id, order_by=lesson_order
+                ).label("position"),
+                func.row_number().over(
+                    partition_by=(UserLesson.user_id, UserLesson.status), order_by=lesson_order
+                ).label("status_position"),
+                func.lag(UserLesson.completed_at).over(
+                    partition_by=UserLesson.user_id, order_by=lesson_order
+                ).label("previous_completed_at"),
+            )
+            .join(DailyLesson, DailyLesson.id == UserLesson.daily_lesson_id)
+            .join(Week, Week.id == DailyLesson.week_id)
+            .join(UserJourney, and_(
+                UserJourney.user_id == UserLesson.user_id,
+                UserJourney.status == JourneyStatus.ACTIVE,
+                Week.topic_key == func.lower(UserJourney.current_category)
+            ))
+            .where(UserLesson.user_id.in_(user_ids))
+            .cte("ordered_lessons")
+        )
+        
+        return select(ordered_lessons.c.id).where(
+            ordered_lessons.c.status == LessonStatus.LOCKED,
+            ordered_lessons.c.status_position == 1,
+            or_(
+                ordered_lessons.c.position == 1,
+                ordered_lessons.c.previous_completed_at.isnot(None)
+            )
+        )
 
-    async def send_daily_reminders(self) -> int:
+    async def send_daily_reminders(self, now: Optional[datetime] = None) -> int:
         """
         Send reminders to users with uncompleted AVAILABLE lessons
         Supports multiple timezones (ET, CT, MT, PT, BDT)
         
         Reminder Logic:
-        - reminder_type "0": No reminders
-        - reminder_type "1": One reminder at reminder_time
-        - reminder_type "2": Two reminders (at reminder_time + 2 hours later)
+        - reminder_type 0: No reminders
+        - reminder_type 1: One reminder at reminder_time
+        - reminder_type 2: Two reminders (at reminder_time + 2 hours later)
         
         Optimization:
-        - Calculate current hour for each timezone
-        - Filter users by matching reminder_time hours only
+        - Calculate current hour and weekday for each timezone
+        - Match reminder hour, type and active day per timezone in SQL
+        
+        Args:
+            now: Current UTC time (defaults to the time of the call)
         
         Returns:
             int: Number of reminders sent
         """
-        now = datetime.now(timezone.utc)
-        sent_count = 0
+        now = now or datetime.now(timezone.utc)
+        
+        user_tz_code = _user_timezone_code()
+        reminder_hour = UserPreferences.reminder_time_hour
+        
+        # Per timezone: an active day there, and either the initial reminder
+        # (types 1 and 2) or the type 2 follow-up 2 hours later is due now
+        target_hours = set()
+        current_hour_by_tz = {}
+        schedule_conditions = []
+        for tz_code, tz_info in TZINFO_OBJECTS.items():
+            tz_now = now.astimezone(tz_info)
+            initial_hour = tz_now.hour
+            followup_hour = (tz_now.hour - 2) % 24
+            target_hours.update((initial_hour, followup_hour))
+            current_hour_by_tz[tz_code] = initial_hour
+            schedule_conditions.append(and_(
+                _user_in_timezone(tz_code),
+                UserPreferences.active_days_mask.bitwise_and(1 << tz_now.weekday()) != 0,
+                or_(
+                    reminder_hour == initial_hour,
+                    and_(UserPreferences.reminder_type == 2, reminder_hour == followup_hour)
+                )
+            ))
+        
+        # Nobody's reminder_time falls in a due hour: skip the query entirely
+        if not target_hours & _get_configured_hours(self.db, UserPreferences.reminder_time_hour):
+            logger.debug("reminders: due=0 sent=0")
+            return 0
+        
+        # OPTIMIZED QUERY: the whole day/hour predicate runs in SQL, so only
+        # users due a reminder right now are returned. The IN on the generated
+        # reminder_time_hour column lets its index narrow the scan.
+        # A reminder is a follow-up when its hour isn't the current hour in the user's timezone.
+        due_reminders = self.db.execute(
+            select(
+                UserPreferences.user_id,
+                UserPreferences.reminder_type,
+                (reminder_hour != case(current_hour_by_tz, value=user_tz_code)).label("is_followup"),
+            ).where(
+                reminder_hour.in_(sorted(target_hours)),
+                UserPreferences.reminder_enabled.is_(True),
+                UserPreferences.reminder_type.in_((1, 2)),
+                or_(*schedule_conditions)
+            )
+        ).all()
         
-        try:
-            print(f"\n{'='*70}")
-            print(f"REMINDER JOB STARTED (Multi-Timezone Optimized)")
-            print(f"{'='*70}")
-            print(f"Current UTC time: {now}")
-            print(f"{'='*70}\n")
-            
-            # Calculate current hour for each timezone
-            timezone_hours = {}
-            for tz_code in ["ET", "CT", "MT", "PT", "BDT"]:
-                tz_hour = get_current_hour_in_timezone(tz_code)
-                timezone_hours[tz_code] = tz_hour
-                print(f"{tz_code}: Current hour = {tz_hour:02d}:00")
-            
-            # Build list of all possible reminder hours to match
-            # For type "1": just the reminder hour
-            # For type "2": reminder hour AND reminder+2 hour
-            target_hours = set()
-            for tz_hour in timezone_hours.values():
-                target_hours.add(tz_hour)  # Initial reminder
-                target_hours.add((tz_hour - 2) % 24)  # Follow-up (2h ago was initial)
-            
-            print(f"\nTarget hours to check: {sorted(target_hours)}")
+        if not due_reminders:
+            logger.debug("reminders: due=0 sent=0")
+            return 0
+        
+        # Count AVAILABLE (uncompleted) lessons for all due users in one query.
+        # Due users are joined as a VALUES list (hash join) rather than a long IN list.
+        due_users = values(column("user_id", Integer), name="due_users").data(
+            [(prefs.user_id,) for prefs in due_reminders]
+        )
+        available_counts = dict(
+            self.db.query(UserLesson.user_id, func.count(UserLesson.id)).join(
+                due_users, due_users.c.user_id == UserLesson.user_id
+            ).filter(
+                UserLesson.status == LessonStatus.AVAILABLE
+            ).group_by(UserLesson.user_id).all()
+        )
+        
+        # Load every user that will be notified in one query
+        # (users who already completed all lessons have no count)
+        users_by_id = {
+            user.id: user
+            for user in self.db.query(User).filter(User.id.in_(list(available_counts))).all()
+        } if available_counts else {}
+        
+        # Build every reminder first, then dispatch them as one batch
+        pending_notifications = []
+        for prefs in due_reminders:
+            available_lessons = available_counts.get(prefs.user_id, 0)
+            if available_lessons == 0:
+                continue  # User already completed all lessons
             
-            # Build query conditions for matching hours
-            hour_conditions = []
-            for hour in target_hours:
-                hour_prefix = f"{hour:02d}:"
-                hour_conditions.append(UserPreferences.reminder_time.like(f"{hour_prefix}%"))
-            
-            # OPTIMIZED QUERY: Only get users with matching reminder_time hours
-            candidates = self.db.query(UserPreferences).filter(
-                UserPreferences.reminder_enabled == "true",
-                UserPreferences.reminder_type != "0",
-                or_(*hour_conditions)  # Match any of the target hours
-            ).all()
-            
-            print(f"Users matched by hour optimization: {len(candidates)}")
-            print()
-            
-            if len(candidates) == 0:
-                print("No users match current hours")
-                print(f"{'='*70}\n")
-                return 0
-            
-            # Get day mapping
-            day_mapping = {0: "mon", 1: "tue", 2: "wed", 3: "thu", 4: "fri", 5: "sat", 6: "sun"}
-            
-            # Process only relevant users
-            for i, prefs in enumerate(candidates, 1):
-                print(f"--- Checking User #{i} (ID: {prefs.user_id}) ---")
-                
-                # Get current hour in USER's timezone
-                user_tz = prefs.timezone or "ET"
-                user_current_hour = get_current_hour_in_timezone(user_tz)
-                print(f"  timezone: {user_tz}")
-                print(f"  current_hour in {user_tz}: {user_current_hour}")
-                
-                # Extract reminder hour from reminder_time
-                reminder_hour = int(prefs.reminder_time.split(":")[0])
-                print(f"  reminder_time: {prefs.reminder_time} (hour: {reminder_hour})")
-                print(f"  reminder_type: {prefs.reminder_type}")
-                print(f"  reminder_enabled: {prefs.reminder_enabled}")
-                print(f"  active_days: {prefs.active_days}")
-                
-                # Determine if we should send reminder THIS HOUR (in USER's timezone)
-                should_send = False
-                reminder_reason = ""
-                
-                if prefs.reminder_type == "1":
-                    # Type 1: Send only at reminder_time
-                    should_send = (user_current_hour == reminder_hour)
-                    reminder_reason = f"Type 1: current({user_current_hour}) == reminder({reminder_hour})? {should_send}"
-                    
-                elif prefs.reminder_type == "2":
-                    # Type 2: Send at reminder_time AND 2 hours later
-                    second_reminder_hour = (reminder_hour + 2) % 24
-                    is_initial = user_current_hour == reminder_hour
-                    is_followup = user_current_hour == second_reminder_hour
-                    should_send = is_initial or is_followup
-                    
-                    if is_initial:
-                        reminder_reason = f"Type 2: Initial reminder (current {user_current_hour} == reminder {reminder_hour})"
-                    elif is_followup:
-                        reminder_reason = f"Type 2: Follow-up reminder (current {user_current_hour} == {reminder_hour}+2)"
-                    else:
-                        reminder_reason = f"Type 2: No match (current {user_current_hour} ≠ {reminder_hour} and ≠ {second_reminder_hour})"
-                
-                print(f"  {reminder_reason}")
-                
-                if not should_send:
-                    print(f"  SKIP: Hour doesn't match\n")
-                    continue
-                
-                # Check if today is an active day (in USER's timezone)
-                # Calculate current day in user's timezone
-                offset_hours = TIMEZONE_OFFSETS.get(user_tz, -5)
-                user_tz_obj = timezone(timedelta(hours=offset_hours))
-                user_now_full = datetime.now(user_tz_obj)
-                user_current_day = day_mapping[user_now_full.weekday()]
-                
-                print(f"  Today ({user_current_day}) in active_days? {user_current_day in prefs.active_days}")
-                if user_current_day not in prefs.active_days:
-                    print(f"  SKIP: Today is not an active day\n")
-                    continue
-                
-                # Check if user has AVAILABLE (uncompleted) lessons
-                available_lessons = self.db.query(UserLesson).filter(
-                    UserLesson.user_id == prefs.user_id,
-                    UserLesson.status == LessonStatus.AVAILABLE
-                ).count()
-                
-                print(f"  AVAILABLE lessons: {available_lessons}")
-                
-                if available_lessons == 0:
-                    print(f"  SKIP: No AVAILABLE lessons (all completed or locked)\n")
-                    continue  # User already completed all lessons
-                
-                # Get the first available lesson's reflection prompt and commit info for SMS
-                first_available_lesson = self.db.query(UserLesson).filter(
-                    UserLesson.user_id == prefs.user_id,
-                    UserLesson.status == LessonStatus.AVAILABLE
-                ).join(DailyLesson).first()
-                
-                reflection_prompt = ""
-                commit_by_days = None
-                if first_available_lesson and first_available_lesson.daily_lesson:
-                    reflection_prompt = first_available_lesson.daily_lesson.reflection_prompt
-                    commit_by_days = first_available_lesson.commit_by_days
-                
-                # Send reminder notification
-                is_followup = (user_current_hour != reminder_hour)
-                print(f"  SENDING REMINDER ({'Follow-up' if is_followup else 'Initial'})")
-                
-                await self._send_notification(
-                    user_id=prefs.user_id,
-                    available_lessons=available_lessons,
-                    reminder_type=prefs.reminder_type,
-                    is_followup=is_followup,
-                    reflection_prompt=reflection_prompt,
-                    commit_by_days=commit_by_days
-                )
-                sent_count += 1
-                print()
+            user = users_by_id.get(prefs.user_id)
+            if not user:
+                logger.warning("User %s not found", prefs.user_id)
+                continue
             
-            print(f"{'='*70}")
-            print(f"REMINDER JOB COMPLETED")
-            print(f"{'='*70}")
-            print(f"Total reminders sent: {sent_count}")
-            print(f"{'='*70}\n")
+            # Get the first available lesson's reflection prompt and commit info for SMS
+            first_available_lesson = self.db.query(UserLesson).filter(
+                UserLesson.user_id == prefs.user_id,
+                UserLesson.status == LessonStatus.AVAILABLE
+            ).join(DailyLesson).options(contains_eager(UserLesson.daily_lesson)).first()
             
-            return sent_count
+            reflection_prompt = ""
+            commit_by_days = None
+            if first_available_lesson and first_available_lesson.daily_lesson:
+                reflection_prompt = first_available_lesson.daily_lesson.reflection_prompt
+                commit_by_days = first_available_lesson.commit_by_days
             
-        except Exception as e:
-            raise e
+            # Queue reminder notification
+            pending_notifications.append(dict(
+                user=user,
+                available_lessons=available_lessons,
+                reminder_type=prefs.reminder_type,
+                is_followup=prefs.is_followup,
+                reflection_prompt=reflection_prompt,
+                commit_by_days=commit_by_days
+            ))
+        
+        sent_count = await self._send_notifications(pending_notifications)
+        
+        logger.debug("reminders: due=%d sent=%d", len(due_reminders), sent_count)
+        return sent_count
     
-    async def _send_notification(self, user_id: int, available_lessons: int, reminder_type: str, is_followup: bool = False, reflection_prompt: str = "", commit_by_days: Optional[int] = None):
+    async def _send_notifications(self, notifications: List[Dict[str, Any]]) -> int:
+        """
+        Dispatch a batch of queued reminder notifications concurrently
+        
+        Args:
+            notifications: Keyword arguments for _send_notification, one dict per user
+        
+        Returns:
+            int: Number of notifications dispatched
+        """
+        # Outbound calls overlap, capped so a large batch doesn't flood the SMS provider
+        semaphore = asyncio.Semaphore(NOTIFICATION_CONCURRENCY)
+        
+        async def send_bounded(notification: Dict[str, Any]):
+            async with semaphore:
+                await self._send_notification(**notification)
+        
+        results = await asyncio.gather(
+            *(send_bounded(notification) for notification in notifications),
+            return_exceptions=True
+        )
+        for notification, result in zip(notifications, results):
+            if isinstance(result, Exception):
+                logger.error("Error sending notification to user %s: %s", notification["user"].id, result)
+        return len(notifications)
+    
+    async def _send_notification(self, user: User, available_lessons: int, reminder_type: int, is_followup: bool = False, reflection_prompt: str = "", commit_by_days: Optional[int] = None):
         """
         Send email and SMS notification to user
         
         Args:
-            user_id: User ID to send notification to
+            user: User to send notification to
             available_lessons: Number of available lessons
-            reminder_type: Type of reminder ("0", "1", "2")
+            reminder_type: Type of reminder (0, 1, 2)
             is_followup: Whether this is a follow-up reminder
             reflection_prompt: Reflection prompt from the available lesson
             commit_by_days: Number of days user committed to complete (if exists)
         """
+        user_id = user.id
         try:
-            print("Sending notification to user", user_id)
-            print("Available lessons", available_lessons)
-            print("Reminder type", reminder_type)
-            print("Is followup", is_followup)
-            print("Reflection prompt", reflection_prompt)
-            print("Commit by days", commit_by_days)
-            
-            # Get user details
-            user = self.db.query(User).filter(User.id == user_id).first()
-            
-            if not user:
-                logger.warning(f"User {user_id} not found")
-                print(f"     User {user_id} not found")
-                return
-            
             # Build personalized message based on commit status
             if commit_by_days:
                 # User has committed - modify message based on commit_by_days
@@ -492,31 +493,32 @@ class SchedulerService:
             
             # Send SMS notification
             if user.mobile_number:
-                print(f"     Sending SMS to user {user_id} ({user.mobile_number}): {message}")
-                
                 sms_success = await sms_service.send_sms(
                     to_number=user.mobile_number,
                     message=message
                 )
                 
                 if sms_success:
-                    logger.info(f"SMS sent successfully to user {user_id} ({user.mobile_number})")
-                    print(f"     SMS sent successfully!")
+                    logger.info("SMS sent successfully to user %s (%s)", user_id, user.mobile_number)
                 else:
-                    logger.error(f"Failed to send SMS to user {user_id} ({user.mobile_number})")
-                    print(f"     Failed to send SMS")
+                    logger.error("Failed to send SMS to user %s (%s)", user_id, user.mobile_number)
             else:
-                print(f"     User {user_id} has no mobile number")
+                logger.debug("User %s has no mobile number", user_id)
                 
         except Exception as e:
-            logger.error(f"Error sending notification to user {user_id}: {str(e)}")
-            print(f"     Error: {str(e)}")
+            logger.error("Error sending notification to user %s: %s", user_id, e)
 
 
 # Support email functions
 from app.utils.support_email import create_support_email_content
 from app.utils.email import EmailService
-from app.services.coach_service import get_current_lesson_miss_count
+from app.services.coach_service import count_active_days_between
+from app.models.user_preferences import ALL_DAYS_MASK
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+# Concurrent support email sends (each one is a blocking Brevo API call)
+SUPPORT_EMAIL_WORKERS = 16
 
 
 def get_users_with_missed_lessons(db: Session, min_miss_count: int = 3):
@@ -531,20 +533,49 @@ def get_users_with_missed_lessons(db: Session, min_miss_count: int = 3):
         List of user data with missed lesson count
     """
     try:
-        # Get all users with their preferences
-        users = db.query(User).join(UserPreferences, isouter=True).all()
+        today = datetime.now(timezone.utc).date()
+        
+        # Each user's current lesson: their first AVAILABLE, uncompleted lesson
+        # (same pick as get_current_lesson_miss_count), one row per user
+        current_lessons = select(
+            UserLesson.user_id, UserLesson.unlocked_at
+        ).where(
+            UserLesson.status == LessonStatus.AVAILABLE,
+            UserLesson.completed_at.is_(None)
+        ).order_by(UserLesson.user_id, UserLesson.id).distinct(UserLesson.user_id).subquery()
+        
+        # Users, current lessons and active days in one query instead of
+        # two queries per user
+        rows = db.query(
+            User.id,
+            User.email,
+            User.full_name,
+            User.username,
+            current_lessons.c.unlocked_at,
+            UserPreferences.active_days_mask
+        ).join(
+            current_lessons, current_lessons.c.user_id == User.id
+        ).outerjoin(
+            UserPreferences, UserPreferences.user_id == User.id
+        ).filter(
+            current_lessons.c.unlocked_at.isnot(None)
+        ).all()
         
         users_with_misses = []
         
-        for user in users:
-            miss_count = get_current_lesson_miss_count(db, user.id)
+        for user_id, email, full_name, username, unlocked_at, active_days_mask in rows:
+            miss_count = count_active_days_between(
+                unlocked_at.date(),
+                today,
+                ALL_DAYS_MASK if active_days_mask is None else active_days_mask
+            )
             
             if miss_count == min_miss_count:
                 users_with_misses.append({
-                    'user_id': user.id,
-                    'email': user.email,
-                    'full_name': user.full_name,
-                    'username': user.username,
+                    'user_id': user_id,
+                    'email': email,
+                    'full_name': full_name,
+                    'username': username,
                     'missed_count': miss_count
                 })
         
@@ -556,6 +587,40 @@ def get_users_with_missed_lessons(db: Session, min_miss_count: int = 3):
         return []
 
 
+def _send_support_email(email_service: EmailService, user_data: dict) -> bool:
+    """
+    Send one support email
+    
+    Args:
+        email_service: Shared email service
+        user_data: Entry from get_users_with_missed_lessons
+    
+    Returns:
+        bool: True if the email was sent
+    """
+    try:
+        # Create email content
+        html_content, text_content = create_support_email_content(user_data)
+        
+        # Send email
+        success = email_service.send_email(
+            to_email=user_data['email'],
+            subject="We're here to help with your lessons",
+            html_content=html_content,
+            text_content=text_content
+        )
+        
+        if success:
+            logger.info(f"Support email sent to {user_data['email']} (missed: {user_data['missed_count']})")
+        else:
+            logger.error(f"Failed to send support email to {user_data['email']}")
+        return success
+        
+    except Exception as e:
+        logger.error(f"Error sending support email to {user_data['email']}: {e}")
+        return False
+
+
 def send_support_email_to_struggling_users(db: Session, min_miss_count: int = 3):
     """
     Send support emails to users who have missed lessons
@@ -571,35 +636,17 @@ def send_support_email_to_struggling_users(db: Session, min_miss_count: int = 3)
         email_service = EmailService()
         users_with_misses = get_users_with_missed_lessons(db, min_miss_count=min_miss_count)
         
-        sent_count = 0
-        failed_count = 0
-        failed_emails = []
-        
-        for user_data in users_with_misses:
-            try:
-                # Create email content
-                html_content, text_content = create_support_email_content(user_data)
-                
-                # Send email
-                success = email_service.send_email(
-                    to_email=user_data['email'],
-                    subject="We're here to help with your lessons",
-                    html_content=html_content,
-                    text_content=text_content
-                )
-                
-                if success:
-                    sent_count += 1
-                    logger.info(f"Support email sent to {user_data['email']} (missed: {user_data['missed_count']})")
-                else:
-                    failed_count += 1
-                    failed_emails.append(user_data['email'])
-                    logger.error(f"Failed to send support email to {user_data['email']}")
-                    
-            except Exception as e:
-                failed_count += 1
-                failed_emails.append(user_data['email'])
-                logger.error(f"Error sending support email to {user_data['email']}: {e}")
+        # Sends are independent and I/O-bound, so run them concurrently
+        with ThreadPoolExecutor(max_workers=SUPPORT_EMAIL_WORKERS) as executor:
+            results = list(executor.map(partial(_send_support_email, email_service), users_with_misses))
+        
+        failed_emails = [
+            user_data['email']
+            for user_data, success in zip(users_with_misses, results)
+            if not success
+        ]
+        failed_count = len(failed_emails)
+        sent_count = len(users_with_misses) - failed_count
         
         result = {
             'total_users': len(users_with_misses),
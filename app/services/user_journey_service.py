@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, insert
 from sqlalchemy.orm.attributes import flag_modified
 
 from app.models.user_journey import UserJourney, JourneyStatus
@@ -115,14 +115,19 @@ class UserJourneyService:
         ).first()
         
         if not journey:
-            raise APIException(
-                status_code=404,
-                message="Journey not found",
-                success=False
-            )
+            self._raise_journey_not_found()
         
         return journey
 
+    @staticmethod
+    def _raise_journey_not_found():
+        """Raise the 404 for a journey that doesn't exist or belongs to another user"""
+        raise APIException(
+            status_code=404,
+            message="Journey not found",
+            success=False
+        )
+
     def get_active_user_journey(self, user_id: int) -> Optional[UserJourney]:
         """Get the active journey for a user"""
         journey = self.db.query(UserJourney).filter(
@@ -158,13 +163,21 @@ class UserJourneyService:
 
     def complete_category_and_move_to_next(self, user_id: int, journey_id: int) -> UserJourney:
         """Complete current category and reset for next category"""
-        user_journey = self.get_user_journey(user_id, journey_id)
-        
-        # Get assessment result to determine category order based on scores
-        assessment_result = self.db.query(AssessmentResult).filter(
-            AssessmentResult.id == user_journey.assessment_result_id
+        # Load the journey with its assessment result (category order by scores)
+        # and the user's progress row in one query
+        row = self.db.query(UserJourney, AssessmentResult, UserProgress).outerjoin(
+            AssessmentResult, AssessmentResult.id == UserJourney.assessment_result_id
+        ).outerjoin(
+            UserProgress, UserProgress.user_id == UserJourney.user_id
+        ).filter(
+            and_(UserJourney.id == journey_id, UserJourney.user_id == user_id)
         ).first()
         
+        if not row:
+            self._raise_journey_not_found()
+        
+        user_journey, assessment_result, user_progress = row
+        
         if not assessment_result:
             raise APIException(
                 status_code=404,
@@ -232,7 +245,7 @@ class UserJourneyService:
             
         # Update user progress only if a category was actually completed
         if category_was_completed:
-            self._update_user_progress_on_category_completion(user_id, user_journey.current_category)
+            self._update_user_progress_on_category_completion(user_progress, user_journey.current_category)
         
         self.db.commit()
         self.db.refresh(user_journey)
@@ -289,34 +302,36 @@ class UserJourneyService:
     def _initialize_lessons_for_category(self, journey_id: int, user_id: int, category: str):
         """Initialize user lessons for a specific category"""
         
-        # Get all weeks for this category (case-insensitive)
-        weeks = self.db.query(Week).filter(Week.topic.ilike(category)).order_by(Week.week_number).all()
-        
-        lesson_count = 0
-        for week in weeks:
-            # Get all daily lessons for this week
-            daily_lessons = self.db.query(DailyLesson).filter(
-                DailyLesson.week_id == week.id
-            ).order_by(DailyLesson.day_number).all()
+        # Get the daily lessons of every week in this category (case-insensitive)
+        # in one query, ordered by week then day
+        daily_lessons = self.db.query(
+            DailyLesson.id, DailyLesson.week_id, Week.week_number
+        ).join(Week, Week.id == DailyLesson.week_id).filter(
+            Week.topic_key == category.lower()
+        ).order_by(Week.week_number, Week.id, DailyLesson.day_number).all()
+        
+        now = datetime.utcnow()
+        user_lessons = []
+        previous_week_id = None
+        for daily_lesson_id, week_id, week_number in daily_lessons:
+            # First lesson in first week should be available
+            is_first_of_week = week_id != previous_week_id
+            previous_week_id = week_id
+            status = LessonStatus.AVAILABLE if (week_number == 1 and is_first_of_week) else LessonStatus.LOCKED
             
-            for index, daily_lesson in enumerate(daily_lessons):
-                # First lesson in first week should be available
-                status = LessonStatus.AVAILABLE if (week.week_number == 1 and index == 0) else LessonStatus.LOCKED
-                
-                user_lesson = UserLesson(
-                    user_id=user_id,
-                    user_journey_id=journey_id,
-                    daily_lesson_id=daily_lesson.id,
-                    status=status,
-                    days_between_lessons=1
-                )
-                
+            user_lessons.append({
+                "user_id": user_id,
+                "user_journey_id": journey_id,
+                "daily_lesson_id": daily_lesson_id,
+                "status": status,
+                "days_between_lessons": 1,
                 # Set unlocked_at for available lessons
-                if status == LessonStatus.AVAILABLE:
-                    user_lesson.unlocked_at = datetime.utcnow()
-                
-                self.db.add(user_lesson)
-                lesson_count += 1
+                "unlocked_at": now if status == LessonStatus.AVAILABLE else None,
+            })
+        
+        # Insert every lesson with one multi-row INSERT instead of one ORM add per lesson
+        if user_lessons:
+            self.db.execute(insert(UserLesson), user_lessons)
 
     def _create_or_update_user_progress(self, user_id: int, journey_id: int, current_category: str):
         """Create or update user progress"""
@@ -335,10 +350,8 @@ class UserJourneyService:
             user_progress.current_category = current_category
             user_progress.current_week_number = 1
 
-    def _update_user_progress_on_category_completion(self, user_id: int, next_category: Optional[str]):
+    def _update_user_progress_on_category_completion(self, user_progress: Optional[UserProgress], next_category: Optional[str]):
         """Update user progress when a category is completed"""
-        user_progress = self.db.query(UserProgress).filter(UserProgress.user_id == user_id).first()
-        
         if user_progress:
             user_progress.total_categories_completed += 1
             user_progress.current_category = next_category
@@ -1,7 +1,7 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session, aliased, contains_eager, selectinload
+from sqlalchemy import and_, or_, column, func, select, update, values, Integer
 
 from app.models.user_lesson import UserLesson, LessonStatus
 from app.models.user_progress import UserProgress
@@ -32,16 +32,22 @@ class UserLessonService:
 
     def get_user_lessons_by_category(self, user_id: int, category: str) -> List[UserLesson]:
         """Get all user lessons for a specific category"""
-        return self.db.query(UserLesson).join(DailyLesson).join(Week).filter(
+        # Populate daily_lesson/week from the joined rows so callers don't lazy-load per lesson
+        return self.db.query(UserLesson).join(DailyLesson).join(Week).options(
+            contains_eager(UserLesson.daily_lesson).contains_eager(DailyLesson.week)
+        ).filter(
             and_(
                 UserLesson.user_id == user_id,
-                Week.topic.ilike(category)
+                Week.topic_key == category.lower()
             )
         ).order_by(Week.week_number, DailyLesson.day_number).all()
 
     def get_available_lessons(self, user_id: int) -> List[UserLesson]:
         """Get all available lessons for a user"""
-        return self.db.query(UserLesson).filter(
+        # selectinload keeps the lesson query narrow; each distinct daily lesson/week loads once
+        return self.db.query(UserLesson).options(
+            selectinload(UserLesson.daily_lesson).selectinload(DailyLesson.week)
+        ).filter(
             and_(
                 UserLesson.user_id == user_id,
                 UserLesson.status == LessonStatus.AVAILABLE
@@ -186,15 +192,26 @@ class UserLessonService:
 
     def unlock_due_lessons(self) -> int:
         """Unlock lessons that are due (background job)"""
-        lessons_to_unlock = self.get_lessons_due_for_unlock()
-        
-        for lesson in lessons_to_unlock:
-            lesson.status = LessonStatus.AVAILABLE
-            lesson.unlocked_at = datetime.utcnow()
+        lesson_ids = {lesson.id for lesson in self.get_lessons_due_for_unlock()}
+        unlocked_count = 0
+        
+        # One UPDATE for all due lessons instead of a statement per row; the ids
+        # are joined as a VALUES list (UPDATE ... FROM) rather than a long IN list
+        if lesson_ids:
+            due_lessons = values(column("id", Integer), name="due_lessons").data(
+                [(lesson_id,) for lesson_id in lesson_ids]
+            )
+            result = self.db.execute(
+                update(UserLesson)
+                .where(UserLesson.id == due_lessons.c.id)
+                .values(status=LessonStatus.AVAILABLE, unlocked_at=datetime.now(timezone.utc))
+                .execution_options(synchronize_session=False)
+            )
+            unlocked_count = result.rowcount
         
         self.db.commit()
         
-        return len(lessons_to_unlock)
+        return unlocked_count
 
     def _update_user_progress_on_lesson_completion(self, user_id: int, points_earned: int):
         """Update user progress when a lesson is completed"""
@@ -220,52 +237,44 @@ class UserLessonService:
                 next_lesson.unlocked_at = datetime.utcnow()
 
     def _find_next_lesson(self, current_lesson: UserLesson) -> Optional[UserLesson]:
-        """Find the next lesson in sequence"""
-        # Get the daily lesson details
-        daily_lesson = self.db.query(DailyLesson).filter(
-            DailyLesson.id == current_lesson.daily_lesson_id
-        ).first()
-        
-        if not daily_lesson:
-            return None
-        
-        # Find next lesson in same week
-        next_daily_lesson = self.db.query(DailyLesson).filter(
-            and_(
-                DailyLesson.week_id == daily_lesson.week_id,
-                DailyLesson.day_number == daily_lesson.day_number + 1
-            )
-        ).first()
-        
-        if next_daily_lesson:
-            # Next lesson in same week
-            return self.db.query(UserLesson).filter(
+        """
+        Find the next lesson in sequence
+        
+        The next lesson is the following day in the same week, or day 1 of the next
+        week when the week has no following day. Both cases are resolved in a
+        single query.
+        """
+        current_daily_lesson = aliased(DailyLesson)
+        following_daily_lesson = aliased(DailyLesson)
+        
+        next_week_id = select(func.min(Week.id)).where(
+            Week.id > current_daily_lesson.week_id
+        ).scalar_subquery()
+        
+        # The week continues, so the next lesson can't be in the next week
+        # (even if the user has no lesson row for the following day)
+        week_has_following_day = select(following_daily_lesson.id).where(
+            following_daily_lesson.week_id == current_daily_lesson.week_id,
+            following_daily_lesson.day_number == current_daily_lesson.day_number + 1
+        ).exists()
+        
+        return self.db.query(UserLesson).join(
+            DailyLesson, DailyLesson.id == UserLesson.daily_lesson_id
+        ).join(
+            current_daily_lesson, current_daily_lesson.id == current_lesson.daily_lesson_id
+        ).filter(
+            UserLesson.user_id == current_lesson.user_id,
+            or_(
+                # Next lesson in same week
                 and_(
-                    UserLesson.user_id == current_lesson.user_id,
-                    UserLesson.daily_lesson_id == next_daily_lesson.id
-                )
-            ).first()
-        
-        # If no next lesson in same week, find first lesson of next week
-        next_week = self.db.query(Week).filter(
-            Week.id > daily_lesson.week_id
-        ).order_by(Week.id).first()
-        
-        if next_week:
-            first_lesson_next_week = self.db.query(DailyLesson).filter(
+                    DailyLesson.week_id == current_daily_lesson.week_id,
+                    DailyLesson.day_number == current_daily_lesson.day_number + 1
+                ),
+                # First lesson of next week
                 and_(
-                    DailyLesson.week_id == next_week.id,
+                    ~week_has_following_day,
+                    DailyLesson.week_id == next_week_id,
                     DailyLesson.day_number == 1
                 )
-            ).first()
-            
-            if first_lesson_next_week:
-                return self.db.query(UserLesson).filter(
-                    and_(
-                        UserLesson.user_id == current_lesson.user_id,
-                        UserLesson.daily_lesson_id == first_lesson_next_week.id
-                    )
-                ).first()
-        
-        return None
-
+            )
+        ).order_by(DailyLesson.week_id).first()
@@ -1,6 +1,7 @@
 from datetime import datetime, date, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from sqlalchemy.orm import Session
+from sqlalchemy import and_, case, distinct, func
 
 from app.models.user_progress import UserProgress
 from app.models.user_journey import UserJourney
@@ -187,8 +188,9 @@ class UserProgressService:
         
         # Calculate completion rate
         if user_progress.current_category:
-            total_lessons_in_category = self._get_total_lessons_in_category(user_progress.current_category)
-            completed_lessons_in_category = self._get_completed_lessons_in_category(user_id, user_progress.current_category)
+            total_lessons_in_category, completed_lessons_in_category = self._get_category_lesson_counts(
+                user_id, user_progress.current_category
+            )
             
             if total_lessons_in_category > 0:
                 stats["completion_rate"] = round(
@@ -243,19 +245,19 @@ class UserProgressService:
         if user_progress.current_streak_days > user_progress.longest_streak_days:
             user_progress.longest_streak_days = user_progress.current_streak_days
 
-    def _get_total_lessons_in_category(self, category: str) -> int:
-        """Get total number of lessons in a category"""
-        return self.db.query(DailyLesson).join(Week).filter(
-            Week.topic.ilike(category)
-        ).count()
-
-    def _get_completed_lessons_in_category(self, user_id: int, category: str) -> int:
-        """Get number of completed lessons in a category"""
-        return self.db.query(UserLesson).join(DailyLesson).join(Week).filter(
-            UserLesson.user_id == user_id,
-            Week.topic.ilike(category),
-            UserLesson.status == LessonStatus.COMPLETED
-        ).count()
+    def _get_category_lesson_counts(self, user_id: int, category: str) -> Tuple[int, int]:
+        """Get total lessons in a category and how many of them the user completed, in one query"""
+        row = self.db.query(
+            func.count(distinct(DailyLesson.id)).label("total"),
+            func.sum(case((UserLesson.status == LessonStatus.COMPLETED, 1), else_=0)).label("completed")
+        ).select_from(DailyLesson).join(Week).outerjoin(
+            UserLesson,
+            and_(UserLesson.daily_lesson_id == DailyLesson.id, UserLesson.user_id == user_id)
+        ).filter(
+            Week.topic_key == category.lower()
+        ).one()
+        
+        return row.total, row.completed or 0
 
     def _get_next_milestone(self, user_progress: UserProgress) -> str:
         """Get next milestone for motivation"""
@@ -6,6 +6,7 @@ from app.core.security import get_password_hash, verify_password
 from app.models.user import User
 from app.models.user_preferences import UserPreferences
 from app.schemas.user import UserCreate, UserUpdate
+from app.services.scheduler_service import invalidate_configured_hours
 
 
 def get(db: Session, id: Any) -> Optional[User]:
@@ -50,12 +51,14 @@ def create(db: Session, *, obj_in: UserCreate) -> User:
         lesson_time="09:00",
         timezone="ET",  # Eastern Time as default
         days_between_lessons=1,
-        reminder_enabled="true",
+        reminder_enabled=True,
         reminder_time="14:00",
-        reminder_type="1"
+        reminder_type=1
     )
     db.add(preferences)
     db.commit()
+    # The default lesson/reminder times may be hours the scheduler hasn't seen yet
+    invalidate_configured_hours()
     db.refresh(db_obj)
     return db_obj
 
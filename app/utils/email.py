@@ -10,6 +10,26 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections to Brevo; sized for the support email thread pool
+EMAIL_CONNECTION_POOL_SIZE = 16
+
+# One Brevo client per API key, shared by every EmailService so batches reuse connections
+_brevo_apis = {}
+
+
+def _get_brevo_api(api_key: str) -> sib_api_v3_sdk.TransactionalEmailsApi:
+    """Return the shared Brevo transactional email client for an API key"""
+    api_instance = _brevo_apis.get(api_key)
+    if api_instance is None:
+        configuration = sib_api_v3_sdk.Configuration()
+        configuration.api_key['api-key'] = api_key
+        configuration.connection_pool_maxsize = EMAIL_CONNECTION_POOL_SIZE
+        api_instance = sib_api_v3_sdk.TransactionalEmailsApi(
+            sib_api_v3_sdk.ApiClient(configuration)
+        )
+        _brevo_apis[api_key] = api_instance
+    return api_instance
+
 
 class EmailService:
     """Service for sending emails via Brevo API"""
@@ -21,11 +41,7 @@ class EmailService:
         
         # Configure Brevo API
         if self.brevo_api_key:
-            configuration = sib_api_v3_sdk.Configuration()
-            configuration.api_key['api-key'] = self.brevo_api_key
-            self.api_instance = sib_api_v3_sdk.TransactionalEmailsApi(
-                sib_api_v3_sdk.ApiClient(configuration)
-            )
+            self.api_instance = _get_brevo_api(self.brevo_api_key)
         else:
             self.api_instance = None
     
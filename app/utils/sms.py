@@ -2,11 +2,27 @@
 SMS service using Twilio for sending text messages.
 """
 from twilio.rest import Client
+from twilio.http.http_client import TwilioHttpClient
+from requests.adapters import HTTPAdapter
 from app.core.config import settings
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections to Twilio and threads for blocking sends; the scheduler
+# caps concurrent reminder sends at this size so every in-flight send has both
+SMS_CONNECTION_POOL_SIZE = 50
+
+
+def _pooled_http_client() -> TwilioHttpClient:
+    """Twilio HTTP client whose session keeps up to SMS_CONNECTION_POOL_SIZE connections alive"""
+    http_client = TwilioHttpClient(pool_connections=True)
+    http_client.session.mount("https://", HTTPAdapter(pool_maxsize=SMS_CONNECTION_POOL_SIZE))
+    return http_client
+
 
 class SMSService:
     """SMS service for sending text messages via Twilio."""
@@ -15,13 +31,19 @@ class SMSService:
         """Initialize SMS service with Twilio credentials."""
         self.client = None
         self.from_number = settings.TWILIO_PHONE_NUMBER
+        # Dedicated threads: the default executor (min(32, cpu + 4) threads) would
+        # cap concurrent sends below the connection pool size
+        self._executor = ThreadPoolExecutor(
+            max_workers=SMS_CONNECTION_POOL_SIZE, thread_name_prefix="sms"
+        )
         
         # Initialize Twilio client if credentials are available
         if settings.TWILIO_ACCOUNT_SID and settings.TWILIO_AUTH_TOKEN:
             try:
                 self.client = Client(
                     settings.TWILIO_ACCOUNT_SID,
-                    settings.TWILIO_AUTH_TOKEN
+                    settings.TWILIO_AUTH_TOKEN,
+                    http_client=_pooled_http_client()
                 )
                 logger.info("SMS service initialized successfully")
             except Exception as e:
@@ -74,11 +96,15 @@ class SMSService:
         logger.info(f"Formatted phone number: {to_number} -> {formatted_number}")
             
         try:
-            # Send SMS via Twilio
-            message_obj = self.client.messages.create(
-                body=message,
-                from_=self.from_number,
-                to=formatted_number
+            # Send SMS via Twilio; the client is blocking, so run it off the event loop
+            message_obj = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                partial(
+                    self.client.messages.create,
+                    body=message,
+                    from_=self.from_number,
+                    to=formatted_number
+                )
             )
             
             logger.info(f"SMS sent successfully to {formatted_number} (SID: {message_obj.sid})")
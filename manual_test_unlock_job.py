@@ -1,11 +1,11 @@
 #!/usr/bin/env python3
 """
-Manual test script for daily_lesson_unlock_job function
+Manual test script for hourly_scheduler_job function
 Run this to test the scheduler job manually multiple times
 Updated to work with new immediate next lesson unlocking logic
 """
 
-from app.core.scheduler import daily_lesson_unlock_job
+from app.core.scheduler import hourly_scheduler_job
 from app.core.database import SessionLocal
 from app.models.user_lesson import UserLesson, LessonStatus
 from app.models.user_journey import UserJourney, JourneyStatus
@@ -77,7 +77,7 @@ def get_previous_lesson(db, current_lesson):
 
 def main():
     print("=" * 70)
-    print("MANUAL TEST: daily_lesson_unlock_job (Updated Logic)")
+    print("MANUAL TEST: hourly_scheduler_job (Updated Logic)")
     print("=" * 70)
     print(f"Test started at: {datetime.now()}")
     print()
@@ -178,9 +178,9 @@ def main():
     print("-" * 40)
     
     try:
-        result = daily_lesson_unlock_job()
+        result = hourly_scheduler_job()
         print(f"SUCCESS: Job completed successfully!")
-        print(f"RESULT: {result} lessons unlocked")
+        print(f"RESULT: {result['unlocked']} lessons unlocked, {result['reminders_sent']} reminders sent")
         print()
         
     except Exception as e:
@@ -52,9 +52,9 @@ def display_current_state(db: Session):
     print(f"")
     
     # Count users by reminder_type
-    type_0 = db.query(UserPreferences).filter(UserPreferences.reminder_type == "0").count()
-    type_1 = db.query(UserPreferences).filter(UserPreferences.reminder_type == "1").count()
-    type_2 = db.query(UserPreferences).filter(UserPreferences.reminder_type == "2").count()
+    type_0 = db.query(UserPreferences).filter(UserPreferences.reminder_type == 0).count()
+    type_1 = db.query(UserPreferences).filter(UserPreferences.reminder_type == 1).count()
+    type_2 = db.query(UserPreferences).filter(UserPreferences.reminder_type == 2).count()
     total = db.query(UserPreferences).count()
     
     print(f"User Preferences Summary:")
@@ -84,7 +84,7 @@ def display_detailed_users(db: Session, limit=10):
     
     # Get users with reminders enabled
     users = db.query(UserPreferences).filter(
-        UserPreferences.reminder_enabled == "true"
+        UserPreferences.reminder_enabled.is_(True)
     ).limit(limit).all()
     
     if not users:
@@ -104,9 +104,9 @@ def display_detailed_users(db: Session, limit=10):
         reminder_hour = int(prefs.reminder_time.split(":")[0])
         would_get_reminder = "NO"
         
-        if prefs.reminder_type == "1" and current_hour == reminder_hour:
+        if prefs.reminder_type == 1 and current_hour == reminder_hour:
             would_get_reminder = "YES (Type 1 - Initial)"
-        elif prefs.reminder_type == "2":
+        elif prefs.reminder_type == 2:
             followup_hour = (reminder_hour + 2) % 24
             if current_hour == reminder_hour:
                 would_get_reminder = "YES (Type 2 - Initial)"
@@ -162,7 +162,7 @@ def display_query_optimization(db: Session):
     
     # Old approach: Get all users with reminders enabled
     all_users = db.query(UserPreferences).filter(
-        UserPreferences.reminder_enabled == "true"
+        UserPreferences.reminder_enabled.is_(True)
     ).count()
     
     # New approach: Get only matching users
@@ -173,12 +173,12 @@ def display_query_optimization(db: Session):
     from sqlalchemy import or_, and_
     
     matching_users = db.query(UserPreferences).filter(
-        UserPreferences.reminder_enabled == "true",
-        UserPreferences.reminder_type != "0",
+        UserPreferences.reminder_enabled.is_(True),
+        UserPreferences.reminder_type != 0,
         or_(
             UserPreferences.reminder_time.like(f"{current_hour_prefix}%"),
             and_(
-                UserPreferences.reminder_type == "2",
+                UserPreferences.reminder_type == 2,
                 UserPreferences.reminder_time.like(f"{followup_hour_prefix}%")
             )
         )
@@ -225,12 +225,12 @@ def display_hour_matching_details(db: Session):
     from sqlalchemy import or_, and_
     
     matching_users = db.query(UserPreferences).filter(
-        UserPreferences.reminder_enabled == "true",
-        UserPreferences.reminder_type != "0",
+        UserPreferences.reminder_enabled.is_(True),
+        UserPreferences.reminder_type != 0,
         or_(
             UserPreferences.reminder_time.like(f"{current_hour_prefix}%"),
             and_(
-                UserPreferences.reminder_type == "2",
+                UserPreferences.reminder_type == 2,
                 UserPreferences.reminder_time.like(f"{followup_hour_prefix}%")
             )
         )
@@ -248,7 +248,7 @@ def display_hour_matching_details(db: Session):
         match_reason = ""
         if current_hour == reminder_hour:
             match_reason = "Initial reminder"
-        elif prefs.reminder_type == "2" and current_hour == (reminder_hour + 2) % 24:
+        elif prefs.reminder_type == 2 and current_hour == (reminder_hour + 2) % 24:
             match_reason = "Follow-up reminder (2 hours after initial)"
         
         available_lessons = db.query(UserLesson).filter(